@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# ---------------------------------------
+# SERVER-SIDE CHART AGGREGATES
+# ---------------------------------------
+# Charts drawn straight from row-level frames (px.bar, px.histogram, px.box,
+# px.pie on df) ship one value per student to the browser and let plotly
+# aggregate there: the payload grows with the dataset, and px.bar of raw
+# rows stacks (sums) the values instead of averaging them. These helpers
+# reduce the rows in pandas first, so a figure only carries one value per
+# bar, bin or box whatever the number of rows.
+
+
+def group_means(df, by, value):
+    """Mean ``value`` per group of ``by``, in category order."""
+    return df.groupby(by, observed=True)[value].mean().reset_index()
+
+
+def group_counts(df, by, name="count"):
+    """Number of rows per group of ``by``, in category order."""
+    return df.groupby(by, observed=True).size().reset_index(name=name)
+
+
+def histogram_counts(df, x, by=None, bins="auto"):
+    """Bin counts of ``x`` (per ``by`` group) on one shared set of bins.
+
+    Returns ``(counts, width)``: a frame with the bin centre in column ``x``,
+    the ``by`` column when given and "count", and the bin width for the bars.
+    """
+    values = df[x].to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    edges = np.histogram_bin_edges(values[present], bins=bins) if present.any() else np.array([0.0, 1.0])
+    # Right-most edge is inclusive, as in np.histogram
+    bin_index = np.clip(np.searchsorted(edges, values[present], side="right") - 1, 0, len(edges) - 2)
+    centres = (edges[:-1] + edges[1:]) / 2
+
+    keys = {x: centres[bin_index]}
+    if by is not None:
+        keys[by] = df[by].to_numpy()[present]
+    counts = pd.DataFrame(keys).groupby(list(keys), observed=True, sort=True).size().reset_index(name="count")
+    return counts, float(edges[1] - edges[0])
+
+
+def box_stats(df, by, value):
+    """Quartiles, 1.5 IQR whisker ends and outliers of ``value`` per group of ``by``.
+
+    "outliers" lists the distinct values beyond the whiskers of each group;
+    repeated values would be drawn on top of each other anyway.
+    """
+    groups = df.groupby(by, observed=True)[value]
+    stats = groups.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ["q1", "median", "q3"]
+    iqr = stats["q3"] - stats["q1"]
+
+    # Whiskers end at the most extreme values inside the 1.5 IQR limits
+    low_limit = (stats["q1"] - 1.5 * iqr).reindex(df[by]).to_numpy()
+    high_limit = (stats["q3"] + 1.5 * iqr).reindex(df[by]).to_numpy()
+    values = df[value]
+    stats["lowerfence"] = values.where(values.to_numpy() >= low_limit).groupby(df[by], observed=True).min()
+    stats["upperfence"] = values.where(values.to_numpy() <= high_limit).groupby(df[by], observed=True).max()
+    stats["count"] = groups.count()
+
+    beyond = (values.to_numpy() < low_limit) | (values.to_numpy() > high_limit)
+    outliers = (
+        pd.DataFrame({by: df[by].to_numpy()[beyond], value: values.to_numpy()[beyond]})
+        .drop_duplicates()
+        .sort_values(value)
+        .groupby(by, observed=True)[value]
+        .agg(list)
+    )
+    stats["outliers"] = [outliers.get(group, []) for group in stats.index]
+    return stats.reset_index()
+
+
+def box_figure(stats, by, value, colors, title=None, template=None):
+    """Box plot drawn from ``box_stats`` output, one trace per group.
+
+    Outliers are a marker trace next to each box, as px.box draws them.
+    """
+    fig = go.Figure()
+    for i, row in enumerate(stats.itertuples(index=False)):
+        label = getattr(row, by)
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Box(
+            x=[label],
+            q1=[row.q1],
+            median=[row.median],
+            q3=[row.q3],
+            lowerfence=[row.lowerfence],
+            upperfence=[row.upperfence],
+            name=str(label),
+            legendgroup=str(label),
+            marker_color=color,
+            boxpoints=False,
+        ))
+        if len(row.outliers):
+            fig.add_trace(go.Scatter(
+                x=[label] * len(row.outliers),
+                y=list(row.outliers),
+                mode="markers",
+                name=str(label),
+                legendgroup=str(label),
+                showlegend=False,
+                marker={"color": color, "size": 6},
+                hovertemplate=f"{by}=%{{x}}<br>{value}=%{{y}}<extra></extra>",
+            ))
+    fig.update_layout(
+        title=title,
+        template=template,
+        xaxis_title=by,
+        yaxis_title=value,
+        xaxis={"type": "category"},
+    )
+    return fig
@@ -0,0 +1,431 @@
+import argparse
+import json
+from itertools import product
+from pathlib import Path
+
+import pandas as pd
+
+from aggregates import box_stats, group_counts, group_means, histogram_counts
+from kde import kde_curves
+from kpi_cube import ALL, FilterCube, selected_values
+from parallel_agg import parallel_aggregates
+
+# ---------------------------------------
+# HEADLESS PAGE ANALYTICS
+# ---------------------------------------
+# Every table the objective pages chart or display, as a pure function of
+# the (filtered) rows: no Streamlit, no plotly. Pages call them on the rows
+# their widgets select; the batch runner below calls them for every filter
+# combination and writes the results ahead of traffic.
+#
+# Each function is registered as "<page>/<name>" with the filters it
+# depends on (filter name -> column). compute() applies a filter selection
+# to a frame and calls the function on the matching rows. KPI datasets are
+# the exception: they take the page's FilterCube and the selection itself.
+#
+#   python analytics.py precomputed/                # every dataset
+#   python analytics.py precomputed/ --page objective4
+
+DATASETS = {}
+
+
+class Dataset:
+    def __init__(self, key, func, filters, required, ranges, prepare):
+        self.key = key
+        self.func = func
+        self.filters = filters
+        self.required = required
+        self.ranges = ranges
+        self.prepare = prepare
+
+    @property
+    def page(self):
+        return self.key.split("/", 1)[0]
+
+
+def dataset(key, filters=None, required=(), ranges=None, prepare=None):
+    """Register the decorated function as dataset ``key`` ("<page>/<name>").
+
+    ``filters`` maps filter names to the columns they select on; those in
+    ``required`` have no "All" option. ``ranges`` maps filter names to
+    columns selected by an inclusive ``(lo, hi)`` range. With ``prepare``,
+    the function receives ``prepare(df)`` and the selection instead of the
+    filtered rows.
+    """
+    def register(func):
+        DATASETS[key] = Dataset(key, func, filters or {}, tuple(required), ranges or {}, prepare)
+        return func
+    return register
+
+
+def select_rows(df, ds, **selection):
+    """Rows of ``df`` matching ``selection`` of ``ds``'s filters."""
+    mask = pd.Series(True, index=df.index)
+    for name, col in ds.filters.items():
+        values = selected_values(selection.get(name))
+        if values is not None:
+            mask &= df[col].isin(values)
+    for name, col in ds.ranges.items():
+        if selection.get(name) is not None:
+            lo, hi = selection[name]
+            mask &= df[col].between(lo, hi)
+    return df if mask.all() else df[mask]
+
+
+def compute(key, df, **selection):
+    """Dataset ``key`` for the rows of ``df`` selected by ``selection``."""
+    ds = DATASETS[key]
+    if ds.prepare is not None:
+        return ds.func(ds.prepare(df), **selection)
+    return ds.func(select_rows(df, ds, **selection))
+
+
+# ---------------------------------------
+# OBJECTIVE 1: DEMOGRAPHICS AND CGPA
+# ---------------------------------------
+OBJECTIVE1_FILTERS = {"gender": "Gender", "faculty": "Faculty_Short", "living": "Living_With"}
+OBJECTIVE1_CUBE = dict(
+    dims=("Gender", "Faculty_Short", "Living_With"),
+    measures=("CGPA_Midpoint",),
+    pairs=(("CGPA_Midpoint", "GPA_Midpoint"),),
+    modes=("Living_With",),
+)
+
+
+@dataset("objective1/kpis", OBJECTIVE1_FILTERS, prepare=lambda df: FilterCube(df, **OBJECTIVE1_CUBE))
+def objective1_kpis(cube, gender=None, faculty=None, living=None):
+    selection = {"Gender": gender, "Faculty_Short": faculty, "Living_With": living}
+    kpi = cube.cell(**selection)
+    return {
+        "students": kpi.count,
+        "avg_cgpa": kpi.mean("CGPA_Midpoint"),
+        "top_faculty": cube.best("Faculty_Short", "CGPA_Midpoint", **selection) if not kpi.empty else "N/A",
+        "cgpa_gpa_corr": kpi.corr("CGPA_Midpoint", "GPA_Midpoint") if kpi.count > 1 else 0,
+        "common_living": kpi.mode("Living_With") if not kpi.empty else "N/A",
+    }
+
+
+@dataset("objective1/cgpa_by_gender")
+def cgpa_by_gender(df):
+    return (
+        df.groupby("Gender", observed=True)["CGPA_Midpoint"]
+        .agg(["count", "mean", "median", "std", "min", "max"])
+        .reset_index()
+    )
+
+
+@dataset("objective1/gpa_histogram", {"relationship": "Relationship_Status"}, required=("relationship",))
+def gpa_histogram(df):
+    """GPA bin counts per gender; every row carries the bin ``width``."""
+    counts, width = histogram_counts(df, "GPA_Midpoint", by="Gender")
+    return counts.assign(width=width)
+
+
+@dataset("objective1/gpa_by_gender", {"relationship": "Relationship_Status"}, required=("relationship",))
+def gpa_by_gender(df):
+    return (
+        df.groupby("Gender", observed=True)["GPA_Midpoint"]
+        .agg(["count", "mean", "median", "std", "min", "max"])
+        .reset_index()
+    )
+
+
+@dataset("objective1/cgpa_trend")
+def cgpa_trend(df):
+    return df.groupby(["GPA_Midpoint", "Year_of_Study"], observed=True)["CGPA_Midpoint"].mean().reset_index()
+
+
+@dataset("objective1/cgpa_by_income")
+def cgpa_by_income(df):
+    return group_means(df, "Income_Category", "CGPA_Midpoint")
+
+
+@dataset("objective1/cgpa_by_income_stats")
+def cgpa_by_income_stats(df):
+    return df.groupby("Income_Category", observed=True)["CGPA_Midpoint"].describe().reset_index()
+
+
+@dataset("objective1/study_attendance_cgpa", {"living": "Living_With"}, required=("living",))
+def study_attendance_cgpa(df):
+    """Mean CGPA on the full study-hours x attendance grid (wide)."""
+    return df.pivot_table(
+        index="Study_Hours_Daily",
+        columns="Attendance_Percentage",
+        values="CGPA_Midpoint",
+        aggfunc="mean",
+        # Full grid of every study-hours / attendance label, already in range
+        # order because both columns are ordered categoricals
+        observed=False,
+    )
+
+
+@dataset("objective1/cgpa_by_faculty")
+def cgpa_by_faculty(df):
+    return group_means(df, "Faculty_Short", "CGPA_Midpoint")
+
+
+@dataset("objective1/age_cgpa_stats", ranges={"age_range": "Age_Midpoint"})
+def age_cgpa_stats(df):
+    return df[["CGPA_Midpoint", "Age_Midpoint"]].describe().reset_index()
+
+
+@dataset("objective1/race_stats")
+def race_stats(df):
+    return df.groupby("Races", observed=True)[["CGPA_Midpoint", "GPA_Midpoint"]].describe().reset_index()
+
+
+# ---------------------------------------
+# OBJECTIVE 2: LIFESTYLE AND GPA
+# ---------------------------------------
+LIFESTYLE_COLUMNS = ["Study_Hours_Daily_Midpoint", "Social_Media_Hours_Daily_Midpoint", "Attendance_Midpoint", "GPA_Midpoint"]
+
+
+@dataset("objective2/kpis")
+def objective2_kpis(df):
+    return {
+        "avg_gpa": df["GPA_Midpoint"].mean(),
+        "avg_study": df["Study_Hours_Daily_Midpoint"].mean(),
+        "avg_social": df["Social_Media_Hours_Daily_Midpoint"].mean(),
+        "avg_attendance": df["Attendance_Midpoint"].mean(),
+    }
+
+
+@dataset("objective2/gpa_by_study_hours")
+def gpa_by_study_hours(df):
+    return group_means(df, "Study_Hours_Category", "GPA_Midpoint").round({"GPA_Midpoint": 2})
+
+
+@dataset("objective2/gpa_by_social_media")
+def gpa_by_social_media(df):
+    return box_stats(df, "Social_Media_Hours_Daily", "GPA_Midpoint")
+
+
+@dataset("objective2/gpa_by_health")
+def gpa_by_health(df):
+    return group_means(df, "Health_Issues_Text", "GPA_Midpoint").round({"GPA_Midpoint": 2})
+
+
+@dataset("objective2/gpa_by_attendance")
+def gpa_by_attendance(df):
+    return group_means(df, "Attendance_Midpoint", "GPA_Midpoint")
+
+
+@dataset("objective2/lifestyle_corr")
+def lifestyle_corr(df):
+    return df[LIFESTYLE_COLUMNS].corr()
+
+
+# ---------------------------------------
+# OBJECTIVE 3: LEARNING MODE
+# ---------------------------------------
+OBJECTIVE3_FILTERS = {"year": "Year_of_Study", "faculty": "Faculty_Short", "gender": "Gender"}
+OBJECTIVE3_CUBE = dict(
+    dims=("Year_of_Study", "Faculty_Short", "Gender"),
+    measures=("GPA_Midpoint", "CGPA_Midpoint"),
+    modes=("Learning_Mode",),
+)
+
+
+@dataset("objective3/kpis", OBJECTIVE3_FILTERS, prepare=lambda df: FilterCube(df, **OBJECTIVE3_CUBE))
+def objective3_kpis(cube, year=None, faculty=None, gender=None):
+    kpi = cube.cell(Year_of_Study=year, Faculty_Short=faculty, Gender=gender)
+    return {
+        "students": kpi.count,
+        "avg_gpa": kpi.mean("GPA_Midpoint") if not kpi.empty else 0,
+        "dominant_mode": kpi.mode("Learning_Mode") if not kpi.empty else "N/A",
+        "max_cgpa": kpi.max("CGPA_Midpoint") if not kpi.empty else 0,
+    }
+
+
+@dataset("objective3/mode_counts")
+def mode_counts(df):
+    return group_counts(df, "Learning_Mode")
+
+
+@dataset("objective3/gpa_by_mode")
+def gpa_by_mode(df):
+    return group_means(df, "Learning_Mode", "GPA_Midpoint")
+
+
+@dataset("objective3/cgpa_by_mode_box")
+def cgpa_by_mode_box(df):
+    return box_stats(df, "Learning_Mode", "CGPA_Midpoint")
+
+
+@dataset("objective3/cgpa_by_mode_spread")
+def cgpa_by_mode_spread(df):
+    return df.groupby("Learning_Mode", observed=True)["CGPA_Midpoint"].agg(["min", "median", "max", "std"]).reset_index()
+
+
+@dataset("objective3/mode_by_year", {"year": "Year_of_Study"})
+def mode_by_year(df):
+    return group_counts(df, ["Year_of_Study", "Learning_Mode"])
+
+
+@dataset("objective3/success_matrix")
+def success_matrix(df):
+    # Partial means per faculty partition, merged exactly (process pool on large cohorts)
+    keys = ("Learning_Mode", "Year_of_Study")
+    return parallel_aggregates(df, dict(means=[(keys, "CGPA_Midpoint")])).mean(keys, "CGPA_Midpoint")
+
+
+# ---------------------------------------
+# OBJECTIVE 4: SKILLS AND CO-CURRICULUM
+# ---------------------------------------
+OBJECTIVE4_FILTERS = {
+    "year": "Year_of_Study",
+    "skill": "Skill_Development_Hours_Category",
+    "cocur": "Co_Curriculum_Activities_Text",
+}
+OBJECTIVE4_CUBE = dict(
+    dims=tuple(OBJECTIVE4_FILTERS.values()),
+    measures=("GPA_Midpoint", "CGPA_Midpoint"),
+    modes=("Co_Curriculum_Activities_Text",),
+)
+DENSITY_GROUPS = {"Active Students": "Yes", "Non-Active Students": "No"}
+
+
+@dataset("objective4/kpis", OBJECTIVE4_FILTERS, prepare=lambda df: FilterCube(df, **OBJECTIVE4_CUBE))
+def objective4_kpis(cube, year=None, skill=ALL, cocur=ALL):
+    kpi = cube.cell(
+        Year_of_Study=year,
+        Skill_Development_Hours_Category=skill,
+        Co_Curriculum_Activities_Text=cocur,
+    )
+    return {
+        "students": kpi.count,
+        "avg_gpa": kpi.mean("GPA_Midpoint"),
+        "avg_cgpa": kpi.mean("CGPA_Midpoint"),
+        "active_rate": kpi.share("Co_Curriculum_Activities_Text", "Yes") * 100,
+    }
+
+
+@dataset("objective4/cgpa_density", OBJECTIVE4_FILTERS)
+def cgpa_density(df):
+    """KDE of CGPA for active and non-active students on one shared grid."""
+    activity = df["Co_Curriculum_Activities_Text"]
+    grid, densities = kde_curves({
+        label: df.loc[activity == value, "CGPA_Midpoint"].dropna()
+        for label, value in DENSITY_GROUPS.items()
+    })
+    return pd.DataFrame({"CGPA_Midpoint": grid, **densities})
+
+
+@dataset("objective4/cgpa_by_skill_cocur", OBJECTIVE4_FILTERS)
+def cgpa_by_skill_cocur(df):
+    return df.groupby(
+        ["Skill_Development_Hours_Category", "Co_Curriculum_Activities_Text"], observed=True
+    )["CGPA_Midpoint"].mean().reset_index()
+
+
+@dataset("objective4/skills_cgpa_share", OBJECTIVE4_FILTERS)
+def skills_cgpa_share(df):
+    """Percentage of each skill category's students in each CGPA range (long)."""
+    # Counts from row-range partitions, summed exactly (process pool on large
+    # cohorts); columns come back in CGPA order, low to high. Drop skill
+    # categories / CGPA ranges with no students in the current filter
+    cross_tab = parallel_aggregates(
+        df, dict(crosstabs=[("Skills_Category", "CGPA")]), key=None
+    ).crosstab("Skills_Category", "CGPA")
+    cross_tab = cross_tab.loc[cross_tab.sum(axis=1) > 0, cross_tab.sum(axis=0) > 0]
+
+    percentage = cross_tab.div(cross_tab.sum(axis=1), axis=0) * 100
+    return percentage.reset_index().melt(
+        id_vars="Skills_Category",
+        var_name="CGPA_Range",
+        value_name="Percentage",
+    )
+
+
+@dataset("objective4/cgpa_progression", OBJECTIVE4_FILTERS)
+def cgpa_progression(df):
+    return df.groupby(
+        ["Year_of_Study", "Skill_Development_Hours_Category"], observed=True
+    )["CGPA_Midpoint"].mean().reset_index()
+
+
+@dataset("objective4/cgpa_heatmap", OBJECTIVE4_FILTERS)
+def cgpa_heatmap(df):
+    """Mean CGPA by skill level x co-curricular participation (wide)."""
+    return df.pivot_table(
+        values="CGPA_Midpoint",
+        index="Skill_Development_Hours_Category",
+        columns="Co_Curriculum_Activities_Text",
+        aggfunc="mean",
+        observed=True,
+    )
+
+
+# ---------------------------------------
+# BATCH PRECOMPUTATION
+# ---------------------------------------
+def filter_options(df, ds):
+    """Every selection of ``ds``'s filters the runner precomputes.
+
+    Each filter takes "All" (unless required) or one of its values; range
+    filters are left open.
+    """
+    names, choices = [], []
+    for name, col in ds.filters.items():
+        values = list(df[col].cat.categories) if isinstance(df[col].dtype, pd.CategoricalDtype) \
+            else sorted(df[col].dropna().unique())
+        names.append(name)
+        choices.append(values if name in ds.required else [ALL] + values)
+    return [dict(zip(names, combo)) for combo in product(*choices)]
+
+
+def _as_table(result):
+    # Results are stored as flat frames with string column names
+    if isinstance(result, dict):
+        return pd.DataFrame([result])
+    if not isinstance(result.index, pd.RangeIndex):
+        result = result.reset_index()
+    result = result.copy()
+    result.columns = [
+        "_".join(str(part) for part in col if str(part)) if isinstance(col, tuple) else str(col)
+        for col in result.columns
+    ]
+    return result
+
+
+def precompute(df, ds):
+    """One table of ``ds`` for every filter selection, keyed by filter columns."""
+    source = ds.prepare(df) if ds.prepare is not None else df
+    tables = []
+    for selection in filter_options(df, ds):
+        if ds.prepare is not None:
+            result = ds.func(source, **selection)
+        else:
+            result = ds.func(select_rows(df, ds, **selection))
+        table = _as_table(result)
+        for name, value in selection.items():
+            table.insert(0, f"filter_{name}", str(value))
+        tables.append(table)
+    return pd.concat(tables, ignore_index=True)
+
+
+def main():
+    from data_loader import load_data
+
+    parser = argparse.ArgumentParser(description="Precompute every page dataset for every filter selection.")
+    parser.add_argument("out", help="directory for one Parquet table per dataset")
+    parser.add_argument("--page", action="append", dest="pages", help="only datasets of this page (repeatable)")
+    args = parser.parse_args()
+
+    df = load_data()
+    out = Path(args.out)
+    written = {}
+    for key, ds in DATASETS.items():
+        if args.pages and ds.page not in args.pages:
+            continue
+        table = precompute(df, ds)
+        path = out / f"{key}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table.to_parquet(path, index=False)
+        written[key] = {"rows": len(table), "filters": list(ds.filters) + list(ds.ranges)}
+        print(f"{key}: {len(table)} rows")
+    (out / "index.json").write_text(json.dumps(written, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import analytics
+import charts
+from bitmap_index import BitmapIndex
+from data_loader import DATA_FALLBACK, SHEET_FALLBACK, add_derived_columns
+from kpi_cube import FilterCube
+from schema import apply_schema
+from snapshot import freeze
+from synthetic import SurveyModel
+from trendline import RangeTrend
+
+# ---------------------------------------
+# PAGE ANALYTICS BENCHMARKS
+# ---------------------------------------
+# Times and memory-profiles every computation the pages run (loading,
+# filtering, groupby, pivot_table, crosstab, corr, KDE, figure building)
+# on synthetic cohorts of several sizes, generated by synthetic.SurveyModel
+# from the bundled survey so group cardinalities and skew match the real
+# data.
+#
+#   python benchmark.py                          # 1k, 100k and 1M rows
+#   python benchmark.py --sizes 1000 100000 --out bench.json
+#   python benchmark.py --compare bench.json     # exit 1 on regressions
+#
+# Each case reports the median and minimum of --repeat timed runs and the
+# peak traced allocation of one extra run (tracemalloc sees NumPy and
+# pandas buffers but not Arrow's memory pool). Figure cases also report
+# the size of the JSON payload sent to the browser.
+
+SIZES = [1_000, 100_000, 1_000_000]
+# Makes the live feed fall back to its local file without a real download
+UNREACHABLE_URL = "http://127.0.0.1:9/benchmark.csv"
+REPEAT = 3
+TOLERANCE = 1.25
+# Differences below this are timer noise, whatever the ratio
+NOISE_SECONDS = 0.002
+
+CASES = []
+
+
+def case(page, name):
+    """Register ``func(fixture)`` as benchmark ``page/name``."""
+    def register(func):
+        CASES.append((f"{page}/{name}", func))
+        return func
+    return register
+
+
+# ---------------------------------------
+# SYNTHETIC COHORTS
+# ---------------------------------------
+class Fixture:
+    """A synthetic cohort of ``rows`` students and the files pages read it from."""
+
+    def __init__(self, rows, workdir, seed=0):
+        rng = np.random.default_rng(seed)
+        self.rows = rows
+        self.df = add_derived_columns(SurveyModel(pd.read_csv(DATA_FALLBACK)).sample(rows, seed))
+        self.snapshot = Path(workdir) / f"cohort-{rows}.parquet"
+        self.df.to_parquet(self.snapshot, index=False)
+
+        # The raw export is not modelled; its rows are resampled as they are
+        sheet = pd.read_csv(SHEET_FALLBACK)
+        sheet = sheet.take(rng.integers(0, len(sheet), rows))
+        head = len(sheet) - max(1, len(sheet) // 100)
+        self.sheet_head = sheet.iloc[:head].to_csv(index=False).encode("utf-8")
+        self.sheet_tail = sheet.iloc[head:].to_csv(index=False, header=False).encode("utf-8")
+        self.workdir = workdir
+
+
+# ---------------------------------------
+# CASES: SHARED DATA ACCESS
+# ---------------------------------------
+@case("shared", "load_snapshot")
+def load_snapshot(fx):
+    # read_snapshot() without its per-process memo
+    return freeze(apply_schema(pd.read_parquet(fx.snapshot, columns=[
+        "Gender", "Faculty_Short", "Year_of_Study", "Living_With",
+        "GPA_Midpoint", "CGPA_Midpoint", "Age_Midpoint",
+    ])))
+
+
+@case("shared", "bitmap_filter")
+def bitmap_filter(fx):
+    index = BitmapIndex(fx.df, ("Year_of_Study", "Skill_Development_Hours_Category", "Co_Curriculum_Activities_Text"))
+    return index.take(fx.df, Year_of_Study=[3, 4], Skill_Development_Hours_Category="High")
+
+
+@case("shared", "kpi_cube")
+def kpi_cube(fx):
+    cube = FilterCube(
+        fx.df, ("Gender", "Faculty_Short", "Year_of_Study"),
+        measures=("GPA_Midpoint", "CGPA_Midpoint"), pairs=(("CGPA_Midpoint", "GPA_Midpoint"),),
+        modes=("Learning_Mode",),
+    )
+    return cube.cell(Gender="Female", Faculty_Short=["FSDK", "FKP"]).mean("CGPA_Midpoint")
+
+
+# ---------------------------------------
+# CASES: HOME
+# ---------------------------------------
+@case("home", "live_feed_refresh")
+def live_feed_refresh(fx):
+    from live_feed import LiveResponseFeed
+
+    # The export is served from a local copy (the URL is unreachable): one
+    # full parse, then the offset / prefix-hash path for an appended 1%
+    path = Path(fx.workdir) / f"sheet-{fx.rows}.csv"
+    path.write_bytes(fx.sheet_head)
+    feed = LiveResponseFeed(url=UNREACHABLE_URL, name=f"benchmark-sheet-{fx.rows}", fallback_path=path)
+    feed.refresh()
+    feed.value_counts(feed.columns[2])
+    with open(path, "ab") as f:
+        f.write(fx.sheet_tail)
+    feed.refresh()
+    return feed.csv_bytes
+
+
+# ---------------------------------------
+# CASES: OBJECTIVE 1
+# ---------------------------------------
+# Each case runs the analytics.py (and charts.py) functions the page calls
+@case("objective1", "cgpa_trend")
+def cgpa_trend(fx):
+    return analytics.cgpa_trend(fx.df)
+
+
+@case("objective1", "study_attendance_cgpa")
+def study_attendance_cgpa(fx):
+    return analytics.study_attendance_cgpa(fx.df[fx.df["Living_With"] == "Family"])
+
+
+@case("objective1", "gpa_histogram")
+def gpa_histogram(fx):
+    return analytics.gpa_histogram(fx.df[fx.df["Relationship_Status"] == "Single"])
+
+
+@case("objective1", "figure_age_scatter")
+def age_scatter(fx):
+    trend = RangeTrend(fx.df, x="CGPA_Midpoint", y="Age_Midpoint", key="Age_Midpoint")
+    rows = fx.df[fx.df["Age_Midpoint"].between(18, 30)]
+    return charts.age_scatter(rows, trend.fit(18, 30), (18, 30))
+
+
+@case("objective1", "figure_faculty_bar")
+def faculty_bar(fx):
+    return charts.faculty_bar(analytics.cgpa_by_faculty(fx.df))
+
+
+# ---------------------------------------
+# CASES: OBJECTIVE 2
+# ---------------------------------------
+@case("objective2", "lifestyle_means")
+def lifestyle_means(fx):
+    return [
+        analytics.gpa_by_study_hours(fx.df),
+        analytics.gpa_by_health(fx.df),
+        analytics.gpa_by_attendance(fx.df),
+    ]
+
+
+@case("objective2", "lifestyle_corr")
+def lifestyle_corr(fx):
+    return analytics.lifestyle_corr(fx.df)
+
+
+@case("objective2", "figure_social_media_box")
+def social_media_box(fx):
+    return charts.social_media_box(analytics.gpa_by_social_media(fx.df))
+
+
+# ---------------------------------------
+# CASES: OBJECTIVE 3
+# ---------------------------------------
+@case("objective3", "mode_by_year")
+def mode_by_year(fx):
+    return analytics.mode_by_year(fx.df)
+
+
+@case("objective3", "success_matrix")
+def success_matrix(fx):
+    return analytics.success_matrix(fx.df)
+
+
+# ---------------------------------------
+# CASES: OBJECTIVE 4
+# ---------------------------------------
+@case("objective4", "skills_cgpa_share")
+def skills_cgpa_share(fx):
+    return analytics.skills_cgpa_share(fx.df)
+
+
+@case("objective4", "figure_cgpa_density")
+def cgpa_density(fx):
+    return charts.cgpa_density(analytics.cgpa_density(fx.df))
+
+
+# ---------------------------------------
+# RUNNER
+# ---------------------------------------
+def measure(func, fx, repeat=REPEAT):
+    """Timings and traced peak memory of ``func(fx)``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(fx)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(fx)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = {
+        "seconds_median": statistics.median(times),
+        "seconds_min": min(times),
+        "peak_mb": peak / 2**20,
+    }
+    if hasattr(result, "to_plotly_json"):
+        stats["payload_kb"] = len(result.to_json()) / 1024
+    return stats
+
+
+def run(sizes=SIZES, repeat=REPEAT, select=None, log=sys.stderr):
+    cases = [(name, func) for name, func in CASES if not select or any(s in name for s in select)]
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in sizes:
+            fx = Fixture(rows, workdir)
+            for name, func in cases:
+                stats = measure(func, fx, repeat)
+                results.append({"case": name, "rows": rows, **stats})
+                print(f"{name:42s} {rows:>9,} rows  {stats['seconds_median'] * 1000:9.1f} ms  "
+                      f"{stats['peak_mb']:8.1f} MB", file=log)
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance=TOLERANCE):
+    """Per-case ``(case, rows, baseline_s, current_s, ratio, regressed)`` rows."""
+    previous = {(r["case"], r["rows"]): r for r in baseline["results"]}
+    rows = []
+    for r in report["results"]:
+        old = previous.get((r["case"], r["rows"]))
+        if old is None:
+            continue
+        before, now = old["seconds_median"], r["seconds_median"]
+        ratio = now / before if before > 0 else float("inf")
+        regressed = ratio > tolerance and now - before > NOISE_SECONDS
+        rows.append((r["case"], r["rows"], before, now, ratio, regressed))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard pages' analytics at several cohort sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="cohort sizes in rows")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per case")
+    parser.add_argument("--case", action="append", dest="cases", help="only cases whose name contains this (repeatable)")
+    parser.add_argument("--out", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.repeat, args.cases)
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+    if not args.compare:
+        return 0
+    rows = compare(report, json.loads(Path(args.compare).read_text()), args.tolerance)
+    for name, n, before, now, ratio, regressed in rows:
+        flag = "REGRESSION" if regressed else "ok"
+        print(f"{name:42s} {n:>9,} rows  {before * 1000:9.1f} -> {now * 1000:9.1f} ms  x{ratio:5.2f}  {flag}",
+              file=sys.stderr)
+    return 1 if any(r[-1] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from kpi_cube import selected_values
+
+# ---------------------------------------
+# BITMAP INDEX FOR COHORT FILTERS
+# ---------------------------------------
+# One packed bitset (np.packbits, 1 bit per student) per value of each
+# filter column. A multi-select filter ORs the bitmaps of its chosen
+# values, the filters are ANDed together, and the result is turned into
+# row positions once. Pages then take the selected rows in a single
+# gather instead of copying the frame and slicing it once per filter;
+# with no filter active the shared frame itself is returned.
+#
+# pandas cannot view an arbitrary set of rows without copying, so the gather
+# is one copy of the selected rows (of the projected columns only). When the
+# selection is a contiguous run of rows, take() returns a positional slice
+# instead, which shares the frame's buffers.
+
+# Number of set bits in each byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class BitmapIndex:
+    def __init__(self, df, columns):
+        self.n_rows = len(df)
+        self.columns = list(columns)
+        self._bitmaps = {}
+        for col in self.columns:
+            series = df[col]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype("category")
+            codes = series.cat.codes.to_numpy()
+            self._bitmaps[col] = {
+                value: np.packbits(codes == i)
+                for i, value in enumerate(series.cat.categories)
+            }
+        self._all = np.packbits(np.ones(self.n_rows, dtype=bool))
+
+    def values(self, col):
+        return list(self._bitmaps[col])
+
+    def bitmap(self, **selection):
+        """Packed bitset of the rows matching every ``col=value(s)`` filter.
+
+        A value may be a single label or a list of labels (any of them);
+        "All", None or an empty list leave the column unfiltered.
+        """
+        bits = self._all
+        for col, value in selection.items():
+            wanted = selected_values(value)
+            if wanted is None:
+                continue
+            empty = np.zeros_like(self._all)
+            column_bits = np.bitwise_or.reduce(
+                [self._bitmaps[col].get(v, empty) for v in wanted] or [empty]
+            )
+            bits = bits & column_bits
+        return bits
+
+    def count(self, **selection):
+        return int(_POPCOUNT[self.bitmap(**selection)].sum(dtype=np.int64))
+
+    def rows(self, **selection):
+        """Sorted row positions matching the filters."""
+        bits = np.unpackbits(self.bitmap(**selection), count=self.n_rows)
+        return np.flatnonzero(bits)
+
+    def take(self, df, **selection):
+        """Rows of ``df`` matching the filters; ``df`` itself when nothing is filtered.
+
+        A contiguous selection is a slice sharing ``df``'s buffers; any other
+        selection is gathered into a copy of the matching rows.
+        """
+        if all(selected_values(value) is None for value in selection.values()):
+            return df
+        rows = self.rows(**selection)
+        if len(rows) == 0 or rows[-1] - rows[0] + 1 == len(rows):
+            start = rows[0] if len(rows) else 0
+            return df.iloc[start:start + len(rows)]
+        return df.take(rows)
@@ -0,0 +1,278 @@
+from aggregates import box_figure
+from level_of_detail import lod_bubble, lod_scatter
+from schema import category_orders
+from startup_profile import lazy_module
+from trendline import add_trendline
+
+# plotly is only imported once a figure is actually built
+px = lazy_module("plotly.express")
+go = lazy_module("plotly.graph_objects")
+
+# ---------------------------------------
+# PAGE FIGURES
+# ---------------------------------------
+# Every figure the objective pages draw, as a function of the tables
+# analytics.py computes (or, for row-level charts, of the rows). The pages
+# call these inside cached_figure(); export_reports.py calls the same ones
+# to render static reports, so both show identical charts.
+#
+# Builders must be module-level functions: the exporter sends them to
+# worker processes by name.
+
+
+# ---------------------------------------
+# OBJECTIVE 1: DEMOGRAPHICS AND CGPA
+# ---------------------------------------
+def gender_violin(df):
+    return px.violin(
+        df,
+        x="Gender",
+        y="CGPA_Midpoint",
+        box=True,
+        color="Gender",
+        title="Violin Plot of CGPA Midpoint by Gender"
+    )
+
+
+def gpa_histogram(counts, relationship):
+    # Bin counts come from analytics.gpa_histogram; one bar per bin and gender
+    fig = px.bar(
+        counts,
+        x="GPA_Midpoint",
+        y="count",
+        color="Gender",
+        barmode="overlay",
+        opacity=0.7,
+        title=f"GPA Distribution by Gender ({relationship})"
+    )
+    if len(counts):
+        fig.update_traces(width=counts["width"].iloc[0])
+    return fig
+
+
+def cgpa_trend_line(line_data):
+    return px.line(
+        line_data,
+        x="GPA_Midpoint",
+        y="CGPA_Midpoint",
+        color="Year_of_Study",
+        markers=True,
+        title="Average CGPA by GPA Midpoint and Year of Study"
+    )
+
+
+def income_bar(means):
+    fig = px.bar(
+        means,
+        x="Income_Category",
+        y="CGPA_Midpoint",
+        color="Income_Category",
+        category_orders=category_orders(means, "Income_Category"),
+        title="Average CGPA Midpoint by Income Category"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+
+def study_attendance_heatmap(pivot, living):
+    fig = px.imshow(
+        pivot,
+        text_auto=".2f",
+        aspect="auto",
+        color_continuous_scale=[
+            "#e3f2fd", "#bbdefb", "#90caf9",
+            "#64b5f6", "#42a5f5", "#1e88e5", "#0d47a1"
+        ],
+        title=f"Average CGPA by Study Hours & Attendance ({living})"
+    )
+    fig.update_layout(
+        xaxis_title="Attendance Percentage",
+        yaxis_title="Daily Study Hours"
+    )
+    return fig
+
+
+def faculty_bar(means):
+    fig = px.bar(
+        means,
+        x="Faculty_Short",
+        y="CGPA_Midpoint",
+        color="Faculty_Short",
+        title="Average CGPA Midpoint by Faculty"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+
+def age_scatter(df, trend, age_range):
+    """Level-of-detail scatter of the rows in ``age_range`` with ``trend`` drawn on it."""
+    fig = lod_scatter(
+        df,
+        x="CGPA_Midpoint",
+        y="Age_Midpoint",
+        title=f"Scatter Plot of CGPA vs Age (Age {age_range[0]}–{age_range[1]})",
+        labels={
+            "CGPA_Midpoint": "CGPA",
+            "Age_Midpoint": "Age"
+        }
+    )
+    return add_trendline(fig, trend, df["CGPA_Midpoint"].min(), df["CGPA_Midpoint"].max())
+
+
+def race_bubble(df):
+    return lod_bubble(
+        df,
+        x="CGPA_Midpoint",
+        y="Races",
+        size="GPA_Midpoint",
+        color="GPA_Midpoint",
+        color_continuous_scale="Viridis",
+        title="Bubble Chart of GPA and CGPA by Race",
+        size_max=40
+    )
+
+
+# ---------------------------------------
+# OBJECTIVE 2: LIFESTYLE AND GPA
+# ---------------------------------------
+def study_hours_bar(means):
+    fig = px.bar(means, x='Study_Hours_Category', y='GPA_Midpoint', color='Study_Hours_Category',
+                 text="GPA_Midpoint", category_orders={'Study_Hours_Category': ['Low', 'Medium', 'High']},
+                 color_discrete_sequence=px.colors.qualitative.Pastel, template="simple_white")
+    fig.update_traces(textposition="inside")
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+def social_media_box(stats):
+    # Quartiles and whiskers come from box_stats; the browser gets one box per category
+    fig = box_figure(stats, 'Social_Media_Hours_Daily', 'GPA_Midpoint',
+                     colors=px.colors.qualitative.Pastel, template="simple_white")
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+def health_bar(means):
+    fig = px.bar(means, x='Health_Issues_Text', y='GPA_Midpoint', color='Health_Issues_Text',
+                 text="GPA_Midpoint", category_orders={'Health_Issues_Text': ['No', 'Yes']},
+                 color_discrete_sequence=px.colors.qualitative.Pastel, template="simple_white")
+    fig.update_traces(textposition="inside")
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+def attendance_line(means):
+    fig = px.line(means, x='Attendance_Midpoint', y='GPA_Midpoint', markers=True, template="simple_white")
+    fig.update_traces(line_color='#AEC6CF', marker=dict(size=10, color='#FFB347'))
+    return fig
+
+
+def correlation_heatmap(corr):
+    return px.imshow(
+        corr, text_auto=".2f", aspect="auto", color_continuous_scale='RdBu_r', template="simple_white"
+    )
+
+
+# ---------------------------------------
+# OBJECTIVE 3: LEARNING MODE
+# ---------------------------------------
+def learning_mode_pie(counts):
+    return px.pie(
+        counts, names='Learning_Mode', values='count', hole=0.4,
+        color_discrete_sequence=px.colors.qualitative.Pastel,
+        title="Distribution of Preferred Learning Modes"
+    )
+
+
+def gpa_by_mode_bar(means):
+    return px.bar(
+        means, x='Learning_Mode', y='GPA_Midpoint',
+        text_auto='.2f',
+        color_discrete_sequence=px.colors.sequential.Viridis,
+        title="Comparison of Mean GPA Across Learning Modes"
+    )
+
+
+def cgpa_by_mode_box(stats):
+    return box_figure(
+        stats, 'Learning_Mode', 'CGPA_Midpoint',
+        colors=px.colors.sequential.Viridis[:1],
+        title="CGPA Variability and Spread per Learning Mode"
+    )
+
+
+def mode_by_year_bar(counts, year):
+    return px.bar(
+        counts,
+        x='Year_of_Study', y='count', color='Learning_Mode',
+        barmode='stack', color_discrete_sequence=px.colors.qualitative.Set2,
+        title=f"Learning Mode Distribution: {year}"
+    )
+
+
+def success_matrix_heatmap(means):
+    return px.density_heatmap(
+        means, x='Year_of_Study', y='Learning_Mode', z='CGPA_Midpoint',
+        text_auto=".2f", color_continuous_scale="Viridis",
+        labels={'CGPA_Midpoint': 'Avg CGPA'},
+        title="Success Matrix: Year vs. Mode"
+    )
+
+
+# ---------------------------------------
+# OBJECTIVE 4: SKILLS AND CO-CURRICULUM
+# ---------------------------------------
+DENSITY_COLORS = {'Active Students': '#667eea', 'Non-Active Students': '#764ba2'}
+
+
+def cgpa_density(density):
+    # Both curves come from one batched FFT KDE on a shared grid
+    fig = go.Figure()
+    for label in density.columns.drop('CGPA_Midpoint'):
+        fig.add_trace(go.Scatter(
+            x=density['CGPA_Midpoint'], y=density[label], mode='lines', name=label,
+            line={'color': DENSITY_COLORS[label]},
+        ))
+    return fig
+
+
+def skill_cocurricular_bar(means):
+    return px.bar(
+        means,
+        x='Skill_Development_Hours_Category',
+        y='CGPA_Midpoint',
+        color='Co_Curriculum_Activities_Text',
+        barmode='group',
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+
+
+def skills_cgpa_share(percentage):
+    return px.bar(
+        percentage,
+        y='Skills_Category',
+        x='Percentage',
+        color='CGPA_Range',
+        orientation='h',
+        text=percentage['Percentage'].round(1),
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+
+
+def cgpa_progression_line(means):
+    return px.line(
+        means,
+        x='Year_of_Study',
+        y='CGPA_Midpoint',
+        color='Skill_Development_Hours_Category',
+        markers=True
+    )
+
+
+def cgpa_heatmap(pivot):
+    return px.imshow(
+        pivot,
+        text_auto='.2f',
+        color_continuous_scale='PuBu',
+        aspect='auto'
+    )
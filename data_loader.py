@@ -0,0 +1,114 @@
+import pandas as pd
+import streamlit as st
+
+import dataset_cache
+import snapshot
+from bitmap_index import BitmapIndex
+from kpi_cube import FilterCube
+from range_labels import range_bounds
+from schema import apply_schema, read_csv_dtypes
+from trendline import RangeTrend
+
+# ---------------------------------------
+# SHARED DATA ACCESS FOR ALL DASHBOARD PAGES
+# ---------------------------------------
+# Every page in main.py's st.navigation imports load_data() from here, so the
+# cleaned dataset is downloaded, parsed and enriched once per server process
+# and the same frame is handed to every page and every session.
+# Pages must treat the returned frame as read-only: filter it, never assign
+# new columns to it. Its buffers are non-writeable (snapshot.freeze), so an
+# in-place write to its values raises.
+# Downloads go through dataset_cache, so a restart or a cache expiry only
+# costs a conditional GET, and the bundled CSVs are used when offline.
+# Each dataset version is converted once into a Parquet snapshot (see
+# snapshot.py); pages pass the columns they use and only those are read.
+# The home page's live Google Sheets feed lives in live_feed.py.
+
+DATA_URL = "https://raw.githubusercontent.com/nrhdyh/EduTrack/refs/heads/main/cleaned_student_performance_ver2.csv"
+DATA_FALLBACK = dataset_cache.BASE_DIR / "cleaned_student_performance_ver2.csv"
+DATA_NAME = "cleaned_student_performance"
+
+SHEET_URL = (
+    "https://docs.google.com/spreadsheets/d/"
+    "1IVXi1nQYuM_tQolHWv6asvttHkbDRWpSW20VuSptEvw/export?format=csv"
+)
+SHEET_FALLBACK = dataset_cache.BASE_DIR / "STUDENT_PERFORMANCE.csv"
+
+# Seconds between revalidations of each remote copy
+DATA_REVALIDATE_SECONDS = 600
+SHEET_REVALIDATE_SECONDS = 30
+
+
+# ---------------------------------------
+# DERIVED COLUMNS
+# ---------------------------------------
+# Numeric midpoints of range-label columns that the cleaned CSV does not carry
+MIDPOINT_COLUMNS = {
+    "Study_Hours_Daily_Midpoint": "Study_Hours_Daily",
+    "Social_Media_Hours_Daily_Midpoint": "Social_Media_Hours_Daily",
+}
+
+
+def add_midpoint_columns(df):
+    for out, source in MIDPOINT_COLUMNS.items():
+        if source in df.columns:
+            df[out] = range_bounds(df[source])[2]
+    return df
+
+
+def add_derived_columns(df):
+    """Apply the categorical schema and add the columns the pages compute."""
+    return add_midpoint_columns(apply_schema(df))
+
+
+# ---------------------------------------
+# LOAD DATA (ONCE PER PROCESS)
+# ---------------------------------------
+def read_cleaned_csv(path):
+    return add_derived_columns(pd.read_csv(path, dtype=read_csv_dtypes()))
+
+
+@st.cache_resource(show_spinner="Loading EduTrack dataset...", ttl=DATA_REVALIDATE_SECONDS)
+def load_snapshot():
+    """Parquet snapshot of the current dataset version."""
+    path, version, _ = dataset_cache.resolve(DATA_URL, DATA_NAME, fallback_path=DATA_FALLBACK)
+    return snapshot.ensure_snapshot(
+        snapshot.snapshot_path(dataset_cache.CACHE_DIR, DATA_NAME, version),
+        lambda: read_cleaned_csv(path),
+    )
+
+
+def data_version():
+    """Identifier of the dataset version ``load_data`` currently serves."""
+    return load_snapshot().stem
+
+
+def load_data(columns=None):
+    """Shared read-only frame, projected to ``columns`` when given."""
+    # An unchanged upstream file returns the frame built on the previous call
+    return snapshot.read_snapshot(load_snapshot(), columns)
+
+
+# Structures built from the frame are keyed on the dataset version the caller
+# got from data_version(), so they switch to a new upload together with the
+# figure cache instead of on a timer of their own. Entries of old versions
+# are evicted once more than MAX_VERSION_ENTRIES are cached.
+MAX_VERSION_ENTRIES = 16
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_VERSION_ENTRIES)
+def load_cube(version, columns, dims, measures=(), pairs=(), modes=()):
+    """KPI filter cube over ``load_data(columns)`` of dataset ``version``."""
+    return FilterCube(load_data(columns), dims, measures=measures, pairs=pairs, modes=modes)
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_VERSION_ENTRIES)
+def load_index(version, columns, dims):
+    """Bitmap index of the ``dims`` filter columns of ``load_data(columns)`` of dataset ``version``."""
+    return BitmapIndex(load_data(columns), dims)
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_VERSION_ENTRIES)
+def load_trend(version, columns, x, y, key):
+    """Running-sum OLS fits of ``y`` on ``x`` over ranges of ``key`` in dataset ``version``."""
+    return RangeTrend(load_data(columns), x, y, key)
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# ---------------------------------------
+# ON-DISK DATASET CACHE
+# ---------------------------------------
+# Remote CSVs are stored on disk together with their ETag / Last-Modified
+# headers. Later loads send a conditional GET; a 304 (or an identical body)
+# keeps the same version id, so callers reuse whatever they already built
+# from it. If the network is unreachable the last cached body is used, and
+# failing that the copy of the dataset bundled in the repository.
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DIR = Path(os.environ.get("EDUTRACK_CACHE_DIR", BASE_DIR / ".cache" / "datasets"))
+FETCH_TIMEOUT = float(os.environ.get("EDUTRACK_FETCH_TIMEOUT", "5"))
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(name):
+    with _locks_guard:
+        return _locks.setdefault(name, threading.Lock())
+
+
+def _paths(name):
+    return CACHE_DIR / f"{name}.csv", CACHE_DIR / f"{name}.json"
+
+
+def _read_meta(meta_path):
+    try:
+        return json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def fetch(url, name, max_age=0):
+    """Bring the disk copy of ``url`` up to date.
+
+    Returns ``(path, version, source)`` where ``version`` identifies the body
+    (used to skip re-parsing) and ``source`` is one of "fresh", "network",
+    "not-modified" or "offline". Returns ``(None, None, "offline")`` when the
+    network fails and nothing is cached yet.
+    """
+    body_path, meta_path = _paths(name)
+    meta = _read_meta(meta_path) if body_path.exists() else {}
+
+    if meta and time.time() - meta.get("checked_at", 0) < max_age:
+        return body_path, meta["sha1"], "fresh"
+
+    request = urllib.request.Request(url)
+    if meta.get("etag"):
+        request.add_header("If-None-Match", meta["etag"])
+    if meta.get("last_modified"):
+        request.add_header("If-Modified-Since", meta["last_modified"])
+
+    try:
+        with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+            body = response.read()
+            headers = response.headers
+    except urllib.error.HTTPError as err:
+        if err.code == 304 and meta:
+            meta["checked_at"] = time.time()
+            _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+            return body_path, meta["sha1"], "not-modified"
+        return (body_path, meta["sha1"], "offline") if meta else (None, None, "offline")
+    except (urllib.error.URLError, OSError):
+        return (body_path, meta["sha1"], "offline") if meta else (None, None, "offline")
+
+    meta = {
+        "url": url,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "sha1": hashlib.sha1(body).hexdigest(),
+        "checked_at": time.time(),
+    }
+    _write_atomic(body_path, body)
+    _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    return body_path, meta["sha1"], "network"
+
+
+def resolve(url, name, fallback_path=None, max_age=0):
+    """Like fetch(), but falls back to the bundled copy instead of returning None."""
+    with _lock_for(name):
+        path, version, source = fetch(url, name, max_age=max_age)
+    if path is None:
+        if fallback_path is None:
+            raise RuntimeError(f"Could not download {url} and no cached or bundled copy exists")
+        path, source = Path(fallback_path), "bundled"
+        version = f"bundled:{path}:{path.stat().st_mtime_ns}"
+    return path, version, source
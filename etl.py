@@ -0,0 +1,221 @@
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from range_labels import parse_ranges, per_label
+
+# ---------------------------------------
+# ETL: RAW GOOGLE FORMS EXPORT -> CLEANED SCHEMA
+# ---------------------------------------
+# Rebuilds cleaned_student_performance_ver2.csv from STUDENT_PERFORMANCE.csv.
+# Every step is a vectorized pandas string/regex operation or a numpy
+# select; there is no per-row Python. With --incremental only responses
+# added to the export since the last run are transformed and appended.
+#
+#   python etl.py STUDENT_PERFORMANCE.csv cleaned_student_performance_ver2.csv
+#   python etl.py new_export.csv cleaned.csv --incremental
+
+BASE_DIR = Path(__file__).resolve().parent
+RAW_PATH = BASE_DIR / "STUDENT_PERFORMANCE.csv"
+CLEANED_PATH = BASE_DIR / "cleaned_student_performance_ver2.csv"
+
+TIMESTAMP_COLUMN = "Timestamp"
+TIMESTAMP_FORMAT = "%m/%d/%Y %H:%M:%S"
+
+# Raw question text (surrounding whitespace stripped) -> cleaned column
+RAW_COLUMNS = {
+    "Gender": "Gender",
+    "Age (Years)": "Age",
+    "Races": "Races",
+    "Faculty": "Faculty",
+    "Year Of Study": "Year_of_Study",
+    "Relationship Status": "Relationship_Status",
+    "With whom you are living with?": "Living_With",
+    "What is your monthly Family Income?": "Family_Income",
+    "Average attendance on class (Percentage )": "Attendance_Percentage",
+    "What was your previous GPA?": "GPA",
+    "What was your previous CGPA?": "CGPA",
+    "How many hour do you study daily? (Hours )": "Study_Hours_Daily",
+    "How many times do you seat for study in a day?": "Study_Sessions",
+    "What is your preferable learning mode?": "Learning_Mode",
+    "How many hour do you spent daily in social media? (Hours)": "Social_Media_Hours_Daily",
+    "What are the skills do you have ?  ( example : Programming)": "Skills",
+    "How many hour do you spent daily on your skill development? (Hours )": "Skill_Development_Hours_Daily",
+    "Are you engaged with any co-curriculum activities?": "Co_Curriculum_Activities",
+    "Do you have any health issues?": "Health_Issues",
+}
+
+CLEANED_COLUMNS = [
+    "Gender", "Age", "Races", "Faculty", "Year_of_Study", "Relationship_Status",
+    "Living_With", "Family_Income", "Attendance_Percentage", "GPA", "CGPA",
+    "Study_Hours_Daily", "Learning_Mode", "Social_Media_Hours_Daily", "Skills",
+    "Skill_Development_Hours_Daily", "Co_Curriculum_Activities", "Health_Issues",
+    "GPA_Midpoint", "CGPA_Midpoint", "Study_Hours_Category",
+    "Social_Media_Hours_Category", "Skill_Development_Hours_Category",
+    "Income_Category", "Attendance_Midpoint", "Age_Midpoint", "Faculty_Short",
+    "Co_Curriculum_Activities_Text", "Health_Issues_Text", "Family_Income_Midpoint",
+    "Study_Sessions_Category", "Cleaned_Skills", "Skills_Category",
+]
+
+# First matching rule wins; anything unmatched is "Others"
+SKILL_RULES = [
+    ("Programming & Development", r"\bprogramming\b|\bcoding\b|\bpython\b|\bdevelopment\b|\bhacking\b"),
+    ("Data & AI", r"\bdata\b|\bdatabase\b|\bmachine learning\b|\bai\b"),
+    ("Design & Multimedia", r"\bdesign|\bdrawing\b|\bphotography\b|\bvideo\b|\bediting\b|\banimation\b"),
+    ("Hardware & Technical Support", r"\brepair|\bhardware\b|\bmaintenance\b"),
+    ("Math & Logic", r"\bmath|\bcalculation|\bproblem ?solving\b"),
+    ("Networking & Cybersecurity", r"\bcyber|\biot\b|\bnetworking\b"),
+    ("Office & Engineering Tools", r"\bautocad\b|\bsketchup\b|\brevit\b|\bmicrosoft\b|\bexcel\b"),
+    ("Soft Skills", r"\bcommunication\b|\bhardworking\b|\bspeech\b|\bteam|\bleadership\b|\bpresenting\b"),
+]
+
+
+# ---------------------------------------
+# VECTORIZED HELPERS
+# ---------------------------------------
+# String work runs on distinct labels only (see range_labels.per_label).
+def level_category(labels, high_from=5):
+    """Low / Medium / High bucket of an hours or sessions label."""
+    lower = parse_ranges(labels)["lower"]
+    return pd.Series(
+        np.select([lower < 1, lower >= high_from], ["Low", "High"], "Medium"),
+        index=labels.index,
+    ).where(labels.notna())
+
+
+def income_category(labels):
+    upper = parse_ranges(labels, open_width=1000)["upper"]
+    return pd.Series(
+        np.select([upper <= 3000, upper <= 8000], ["B40", "M40"], "T20"),
+        index=labels.index,
+    ).where(labels.notna())
+
+
+def clean_skills(skills):
+    return per_label(
+        skills,
+        lambda distinct: distinct.str.lower().str.replace(r"[^a-z0-9\s]", "", regex=True).str.strip(),
+    )
+
+
+def skills_category(cleaned):
+    return per_label(cleaned.fillna(""), _distinct_skills_category)
+
+
+def _distinct_skills_category(cleaned):
+    conditions = [cleaned.str.contains(pattern, regex=True).to_numpy(bool) for _, pattern in SKILL_RULES]
+    return pd.Series(
+        np.select(conditions, [name for name, _ in SKILL_RULES], "Others"),
+        index=cleaned.index,
+    )
+
+
+# ---------------------------------------
+# TRANSFORM
+# ---------------------------------------
+def transform(raw):
+    """Map a raw Google Forms export onto the cleaned schema."""
+    df = raw.rename(columns=lambda c: c.strip())
+    df = df.rename(columns=RAW_COLUMNS)[list(RAW_COLUMNS.values())].copy()
+
+    df["Year_of_Study"] = per_label(
+        df["Year_of_Study"], lambda distinct: distinct.str.extract(r"(\d+)", expand=False)
+    ).astype(int)
+    df["Attendance_Percentage"] = per_label(
+        df["Attendance_Percentage"], lambda distinct: distinct.str.replace("%", "", regex=False)
+    )
+
+    co_curriculum = per_label(df["Co_Curriculum_Activities"], lambda distinct: distinct.str.strip())
+    health = per_label(df["Health_Issues"], lambda distinct: distinct.str.strip())
+    df["Co_Curriculum_Activities"] = (co_curriculum == "Yes").astype(int)
+    df["Health_Issues"] = (health == "Yes").astype(int)
+
+    df["GPA_Midpoint"] = parse_ranges(df["GPA"])["mid"]
+    df["CGPA_Midpoint"] = parse_ranges(df["CGPA"])["mid"]
+    df["Study_Hours_Category"] = level_category(df["Study_Hours_Daily"])
+    df["Social_Media_Hours_Category"] = level_category(df["Social_Media_Hours_Daily"])
+    df["Skill_Development_Hours_Category"] = level_category(df["Skill_Development_Hours_Daily"])
+    df["Income_Category"] = income_category(df["Family_Income"])
+    df["Attendance_Midpoint"] = parse_ranges(df["Attendance_Percentage"])["mid"]
+    df["Age_Midpoint"] = parse_ranges(df["Age"])["mid"]
+    df["Faculty_Short"] = per_label(df["Faculty"], lambda distinct: distinct.str.extract(r"^\s*(\S+)", expand=False))
+    df["Co_Curriculum_Activities_Text"] = co_curriculum
+    df["Health_Issues_Text"] = health
+    df["Family_Income_Midpoint"] = parse_ranges(df["Family_Income"], open_width=1000)["mid"]
+    df["Study_Sessions_Category"] = level_category(df["Study_Sessions"], high_from=4)
+    df["Cleaned_Skills"] = clean_skills(df["Skills"])
+    df["Skills_Category"] = skills_category(df["Cleaned_Skills"])
+
+    return df[CLEANED_COLUMNS]
+
+
+# ---------------------------------------
+# INCREMENTAL RUN
+# ---------------------------------------
+# The export only grows at the bottom, so the state file next to the output
+# records how many raw rows have been consumed and a hash of them. A later
+# run appends every row past that count, whatever its Timestamp (exports
+# have one-second resolution, and unparseable stamps are kept too). If the
+# consumed rows changed (an edited or deleted response) the output is
+# rebuilt from the whole export.
+def state_path(out_path):
+    out_path = Path(out_path)
+    return out_path.with_name(out_path.name + ".state.json")
+
+
+def read_state(out_path):
+    try:
+        state = json.loads(state_path(out_path).read_text())
+        return int(state["rows"]), state["rows_sha1"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def rows_sha1(raw):
+    hashes = pd.util.hash_pandas_object(raw, index=False).to_numpy()
+    return hashlib.sha1(hashes.tobytes()).hexdigest()
+
+
+def run(raw_path=RAW_PATH, out_path=CLEANED_PATH, incremental=False):
+    """Transform ``raw_path`` into ``out_path``; returns the number of rows written."""
+    # Every answer is text; reading it as such keeps the row hashes stable
+    raw = pd.read_csv(raw_path, dtype=str)
+
+    consumed = None
+    state = read_state(out_path) if incremental and Path(out_path).exists() else None
+    if state is not None:
+        rows, digest = state
+        if rows <= len(raw) and rows_sha1(raw.iloc[:rows]) == digest:
+            consumed = rows
+
+    cleaned = transform(raw.iloc[consumed:] if consumed is not None else raw)
+    if consumed is not None:
+        cleaned.to_csv(out_path, mode="a", header=False, index=False)
+    else:
+        cleaned.to_csv(out_path, index=False)
+
+    state_path(out_path).write_text(json.dumps({
+        "rows": len(raw),
+        "rows_sha1": rows_sha1(raw),
+        "timestamp": str(pd.to_datetime(raw[TIMESTAMP_COLUMN], format=TIMESTAMP_FORMAT, errors="coerce").max()),
+    }))
+    return len(cleaned)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the cleaned EduTrack dataset from a raw Google Forms export.")
+    parser.add_argument("raw", help="raw export CSV")
+    parser.add_argument("out", help="cleaned CSV to write")
+    parser.add_argument("--incremental", action="store_true", help="only append rows added since the last run")
+    args = parser.parse_args()
+
+    added = run(args.raw, args.out, incremental=args.incremental)
+    print(f"Wrote {added} cleaned rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
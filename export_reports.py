@@ -0,0 +1,415 @@
+import argparse
+import html
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+import analytics
+import charts
+from kpi_cube import ALL
+from trendline import RangeTrend
+
+# ---------------------------------------
+# STATIC REPORT EXPORT
+# ---------------------------------------
+# Writes standalone HTML snapshots of the objective pages, one per page and
+# filter selection ("All" or a single value for each page filter, as in
+# analytics.filter_options). A report holds the page's KPIs for that
+# selection and every chart and summary table the page shows; charts with a
+# selector of their own (relationship status, living arrangement, focus
+# year) are drawn once per option.
+#
+# Work is shared across the whole export:
+#   - analytics datasets are computed once per selection of the filters they
+#     actually depend on, so the objective 1 and 3 charts (which the page
+#     filters do not touch) are aggregated once for all of their reports;
+#   - each distinct figure is rendered to an HTML fragment once, in a pool
+#     of worker processes, and pasted into every report that shows it.
+# plotly.js is written once next to the reports instead of into each file
+# (--standalone embeds it in every report, about 3.5 MB each).
+#
+#   python export_reports.py reports/
+#   python export_reports.py reports/ --vary faculty --vary year
+#   python export_reports.py reports/ --page objective4 --workers 8
+#
+#   EDUTRACK_EXPORT_WORKERS   render processes (default: CPU count)
+
+WORKERS = int(os.environ.get("EDUTRACK_EXPORT_WORKERS", "0")) or os.cpu_count() or 1
+PLOTLY_JS = "plotly.min.js"
+
+PAGES = {}
+
+
+def report_page(page, title):
+    """Register the decorated ``func(data, selection) -> (kpis, sections)`` for ``page``."""
+    def register(func):
+        PAGES[page] = (title, func)
+        return func
+    return register
+
+
+class Section:
+    """One chart of a report, with the summary table shown under it.
+
+    ``chart`` is a charts.py builder called as ``chart(*args)``; ``depends``
+    names what the figure varies with, so equal figures are rendered once.
+    """
+
+    def __init__(self, heading, chart, args, depends=None, table=None):
+        self.heading = heading
+        self.chart = chart
+        self.args = args
+        self.table = table
+        self.key = (chart.__name__, tuple(sorted((depends or {}).items())))
+
+
+class Datasets:
+    """analytics datasets over ``df``, each computed once per relevant selection."""
+
+    def __init__(self, df):
+        self.df = df
+        self._prepared = {}
+        self._rows = {}
+        self._results = {}
+
+    def get(self, key, **selection):
+        ds = analytics.DATASETS[key]
+        # Filters the dataset does not declare cannot change its result
+        relevant = {name: selection.get(name, ALL) for name in ds.filters}
+        relevant.update({name: selection[name] for name in ds.ranges if selection.get(name) is not None})
+        memo = (key, tuple(relevant.items()))
+        if memo not in self._results:
+            if ds.prepare is not None:
+                if key not in self._prepared:
+                    self._prepared[key] = ds.prepare(self.df)
+                result = ds.func(self._prepared[key], **relevant)
+            else:
+                result = ds.func(self._select(ds, relevant))
+            self._results[memo] = result
+        return self._results[memo]
+
+    def _select(self, ds, relevant):
+        # Datasets filtered on the same columns share the selected rows
+        key = (tuple(ds.filters.items()), tuple(ds.ranges.items()), tuple(relevant.items()))
+        if key not in self._rows:
+            self._rows[key] = analytics.select_rows(self.df, ds, **relevant)
+        return self._rows[key]
+
+    def __len__(self):
+        return len(self._results)
+
+
+def _options(df, col):
+    return list(df[col].cat.categories)
+
+
+# ---------------------------------------
+# OBJECTIVE 1: DEMOGRAPHICS AND CGPA
+# ---------------------------------------
+@report_page("objective1", "🎓 Demographic Characteristics and Academic Factors Influencing UMK Students Performance")
+def objective1_report(data, selection):
+    df = data.df
+    kpis = data.get("objective1/kpis", **selection)
+    cards = [
+        ("📈 Average CGPA", f"{kpis['avg_cgpa']:.2f}"),
+        ("🏆 Top Faculty", kpis["top_faculty"]),
+        ("🔗 CGPA–GPA Correlation", f"{kpis['cgpa_gpa_corr']:.2f}"),
+        ("🏠 Common Living", kpis["common_living"]),
+    ]
+
+    sections = [Section(
+        "1️⃣ Violin Plot: CGPA Distribution by Gender",
+        charts.gender_violin, (df[["Gender", "CGPA_Midpoint"]],),
+        table=data.get("objective1/cgpa_by_gender"),
+    )]
+    for relationship in _options(df, "Relationship_Status"):
+        sections.append(Section(
+            f"2️⃣ Histogram: GPA Distribution by Gender ({relationship})",
+            charts.gpa_histogram,
+            (data.get("objective1/gpa_histogram", relationship=relationship), relationship),
+            depends={"relationship": relationship},
+            table=data.get("objective1/gpa_by_gender", relationship=relationship),
+        ))
+
+    line_data = data.get("objective1/cgpa_trend")
+    sections.append(Section(
+        "3️⃣ Line Chart: CGPA Trend by GPA and Year of Study",
+        charts.cgpa_trend_line, (line_data,),
+        table=line_data[["GPA_Midpoint", "CGPA_Midpoint"]].describe().reset_index(),
+    ))
+    sections.append(Section(
+        "4️⃣ Bar Chart: Average CGPA by Income Category",
+        charts.income_bar, (data.get("objective1/cgpa_by_income"),),
+        table=data.get("objective1/cgpa_by_income_stats"),
+    ))
+    for living in _options(df, "Living_With"):
+        pivot = data.get("objective1/study_attendance_cgpa", living=living)
+        sections.append(Section(
+            f"5️⃣ Heatmap: Study Hours vs Attendance ({living})",
+            charts.study_attendance_heatmap, (pivot, living),
+            depends={"living": living},
+            table=pivot.stack().describe().reset_index().rename(columns={0: "CGPA_Midpoint"}),
+        ))
+
+    faculty_avg = data.get("objective1/cgpa_by_faculty")
+    sections.append(Section(
+        "6️⃣ Bar Chart: Average CGPA by Faculty",
+        charts.faculty_bar, (faculty_avg,),
+        table=faculty_avg.rename(columns={"CGPA_Midpoint": "Average_CGPA"}),
+    ))
+
+    # The page's age slider starts on the full range
+    age_range = (int(df["Age_Midpoint"].min()), int(df["Age_Midpoint"].max()))
+    rows = df[["CGPA_Midpoint", "Age_Midpoint"]]
+    trend = RangeTrend(rows, x="CGPA_Midpoint", y="Age_Midpoint", key="Age_Midpoint").fit(*age_range)
+    sections.append(Section(
+        "7️⃣ Scatter Plot: Relationship Between CGPA and Age",
+        charts.age_scatter, (rows, trend, age_range),
+        table=data.get("objective1/age_cgpa_stats", age_range=age_range),
+    ))
+    sections.append(Section(
+        "8️⃣ Bubble Chart: GPA & CGPA by Race",
+        charts.race_bubble, (df[["CGPA_Midpoint", "Races", "GPA_Midpoint"]],),
+        table=data.get("objective1/race_stats"),
+    ))
+    return cards, sections
+
+
+# ---------------------------------------
+# OBJECTIVE 2: LIFESTYLE AND GPA
+# ---------------------------------------
+@report_page("objective2", "🎓 Relationship between Study Habits, Social Media Usage and Health Factors in influencing Academic Performance of UMK Students.")
+def objective2_report(data, selection):
+    kpis = data.get("objective2/kpis")
+    cards = [
+        ("🏆 Average GPA", f"{kpis['avg_gpa']:.2f}"),
+        ("✍️ Avg Study Hours Daily", f"{kpis['avg_study']:.1f} hrs"),
+        ("🤳 Avg Social Media Daily", f"{kpis['avg_social']:.1f} hrs"),
+        ("🎒 Avg Attendance", f"{kpis['avg_attendance']:.1f}%"),
+    ]
+    sections = [
+        Section("1️⃣ Bar Chart: Average GPA by Study Hours",
+                charts.study_hours_bar, (data.get("objective2/gpa_by_study_hours"),)),
+        Section("2️⃣ Box Plot: Social Media Usage and Acedemic Performance",
+                charts.social_media_box, (data.get("objective2/gpa_by_social_media"),)),
+        Section("3️⃣ Bar Chart: Health Issues and Academic Outcomes",
+                charts.health_bar, (data.get("objective2/gpa_by_health"),)),
+        Section("4️⃣ Line Plot: Attendance and Performance Trend",
+                charts.attendance_line, (data.get("objective2/gpa_by_attendance"),)),
+        Section("5️⃣ Correlation Heatmap",
+                charts.correlation_heatmap, (data.get("objective2/lifestyle_corr"),)),
+    ]
+    return cards, sections
+
+
+# ---------------------------------------
+# OBJECTIVE 3: LEARNING MODE
+# ---------------------------------------
+@report_page("objective3", "🎓 Learning Mode Preference, Demographic Factors & Academic Outcomes Among UMK Students")
+def objective3_report(data, selection):
+    kpis = data.get("objective3/kpis", **selection)
+    cards = [
+        ("👥 Total Sample", f"{kpis['students']}"),
+        ("📈 Avg GPA", f"{kpis['avg_gpa']:.2f}"),
+        ("🏆 Dominant Mode", kpis["dominant_mode"]),
+        ("🔥 Peak CGPA", f"{kpis['max_cgpa']:.2f}"),
+    ]
+
+    gpa_by_mode = data.get("objective3/gpa_by_mode")
+    sections = [
+        Section("1️⃣ Learning Mode Preference Distribution",
+                charts.learning_mode_pie, (data.get("objective3/mode_counts"),)),
+        Section("2️⃣ Bar Chart: Average GPA by Learning Mode",
+                charts.gpa_by_mode_bar, (gpa_by_mode,), table=gpa_by_mode),
+        Section("3️⃣ Box Plot: CGPA Distribution by Learning Mode",
+                charts.cgpa_by_mode_box, (data.get("objective3/cgpa_by_mode_box"),),
+                table=data.get("objective3/cgpa_by_mode_spread")),
+    ]
+    for year in [ALL] + _options(data.df, "Year_of_Study"):
+        sections.append(Section(
+            f"4️⃣ Stacked Bar: Mode Preference by Year of Study ({year})",
+            charts.mode_by_year_bar, (data.get("objective3/mode_by_year", year=year), year),
+            depends={"year": year},
+        ))
+    success = data.get("objective3/success_matrix")
+    sections.append(Section("5️⃣ Heatmap: Average CGPA Success Matrix",
+                            charts.success_matrix_heatmap, (success,), table=success))
+    return cards, sections
+
+
+# ---------------------------------------
+# OBJECTIVE 4: SKILLS AND CO-CURRICULUM
+# ---------------------------------------
+@report_page("objective4", "🎓 EduTrack: The Impact of Skill Development and Co-curricular Engagement on Academic Performance")
+def objective4_report(data, selection):
+    kpis = data.get("objective4/kpis", **selection)
+    cards = [
+        ("Total Students", f"{kpis['students']}"),
+        ("Average GPA", f"{kpis['avg_gpa']:.2f}"),
+        ("Average CGPA", f"{kpis['avg_cgpa']:.2f}"),
+        ("Active Participation", f"{kpis['active_rate']:.1f}%"),
+    ]
+    # Every chart on this page follows the page filters
+    sections = [
+        Section("1️⃣ CGPA Density: Active vs Non-Active Students",
+                charts.cgpa_density, (data.get("objective4/cgpa_density", **selection),), selection),
+        Section("2️⃣ Average CGPA by Skill Development & Co-Curricular",
+                charts.skill_cocurricular_bar, (data.get("objective4/cgpa_by_skill_cocur", **selection),), selection),
+        Section("3️⃣ CGPA Distribution by Skills Category",
+                charts.skills_cgpa_share, (data.get("objective4/skills_cgpa_share", **selection),), selection),
+        Section("4️⃣ CGPA Progression by Year & Skill Level",
+                charts.cgpa_progression_line, (data.get("objective4/cgpa_progression", **selection),), selection),
+        Section("5️⃣ Average CGPA Heatmap",
+                charts.cgpa_heatmap, (data.get("objective4/cgpa_heatmap", **selection),), selection),
+    ]
+    return cards, sections
+
+
+# ---------------------------------------
+# SELECTIONS
+# ---------------------------------------
+def selections(df, page, vary=None):
+    """Filter selections ``page`` is exported for.
+
+    With ``vary``, only those filters take single values; the others stay
+    on "All".
+    """
+    ds = analytics.DATASETS[f"{page}/kpis"]
+    return [
+        selection for selection in analytics.filter_options(df, ds)
+        if not vary or all(value == ALL for name, value in selection.items() if name not in vary)
+    ]
+
+
+def report_name(selection):
+    parts = [f"{name}-{value}" for name, value in selection.items() if value != ALL]
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", "_".join(parts)) or "all"
+
+
+def describe(selection):
+    parts = [f"{name.title()}: {value}" for name, value in selection.items() if value != ALL]
+    return ", ".join(parts) or "All students"
+
+
+# ---------------------------------------
+# RENDERING
+# ---------------------------------------
+def _render(job):
+    import plotly.io as pio
+
+    chart, args = job
+    return pio.to_html(chart(*args), full_html=False, include_plotlyjs=False, config={"displaylogo": False})
+
+
+def render_figures(jobs, workers=WORKERS):
+    """``{key: html}`` for ``{key: (chart, args)}``, rendered across ``workers`` processes."""
+    keys = list(jobs)
+    if workers <= 1 or len(keys) < 2:
+        return {key: _render(jobs[key]) for key in keys}
+    # Forked workers start with the modules already imported
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method)) as pool:
+        fragments = pool.map(_render, [jobs[key] for key in keys], chunksize=max(1, len(keys) // (workers * 4)))
+        return dict(zip(keys, fragments))
+
+
+def _table_html(table):
+    if table is None:
+        return ""
+    keep_index = not isinstance(table.index, pd.RangeIndex)
+    return table.to_html(index=keep_index, border=0, classes="stats", float_format=lambda v: f"{v:.2f}", na_rep="")
+
+
+STYLE = """
+body { font-family: sans-serif; margin: 24px auto; max-width: 1200px; color: #1f2937; }
+.cards { display: flex; gap: 16px; margin: 16px 0 24px; }
+.card, h3.section { background: linear-gradient(135deg, #5E35B1, #3949AB); color: white;
+                    border-radius: 10px; text-align: center; padding: 16px; }
+.card { flex: 1; } .card p { font-size: 20px; font-weight: bold; margin: 4px 0 0; }
+table.stats { border-collapse: collapse; margin: 8px 0 32px; font-size: 13px; }
+table.stats th, table.stats td { padding: 4px 10px; border-bottom: 1px solid #e5e7eb; text-align: right; }
+"""
+
+
+def report_html(title, selection, cards, sections, figures, tables, script):
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>",
+        f"<title>{html.escape(title)}</title>",
+        f"{script}<style>{STYLE}</style></head><body>",
+        f"<h1>{html.escape(title)}</h1><p><b>Filters:</b> {html.escape(describe(selection))}</p>",
+        "<div class='cards'>",
+        *(f"<div class='card'>{html.escape(label)}<p>{html.escape(str(value))}</p></div>" for label, value in cards),
+        "</div>",
+    ]
+    for section in sections:
+        parts.append(f"<h3 class='section'>{html.escape(section.heading)}</h3>")
+        parts.append(figures[section.key])
+        parts.append(tables.get(section.key, ""))
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def export_reports(df, out, pages=None, vary=None, workers=WORKERS, standalone=False):
+    """Write every report of ``pages`` (default: all) under ``out``; returns export stats."""
+    out = Path(out)
+    data = Datasets(df)
+    reports, jobs, tables = [], {}, {}
+    for page, (title, build) in PAGES.items():
+        if pages and page not in pages:
+            continue
+        for selection in selections(df, page, vary):
+            cards, sections = build(data, selection)
+            for section in sections:
+                if section.key not in jobs:
+                    jobs[section.key] = (section.chart, section.args)
+                    tables[section.key] = _table_html(section.table)
+            reports.append((page, title, selection, cards, sections))
+
+    figures = render_figures(jobs, workers)
+
+    import plotly.offline
+
+    out.mkdir(parents=True, exist_ok=True)
+    if standalone:
+        script = f"<script>{plotly.offline.get_plotlyjs()}</script>"
+    else:
+        (out / PLOTLY_JS).write_text(plotly.offline.get_plotlyjs(), encoding="utf-8")
+        script = f"<script src='../{PLOTLY_JS}'></script>"
+    links = []
+    for page, title, selection, cards, sections in reports:
+        path = out / page / f"{report_name(selection)}.html"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(report_html(title, selection, cards, sections, figures, tables, script), encoding="utf-8")
+        links.append(f"<li><a href='{page}/{path.name}'>{html.escape(page)}: {html.escape(describe(selection))}</a></li>")
+    (out / "index.html").write_text(
+        f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>EduTrack reports</title></head>"
+        f"<body><h1>EduTrack reports</h1><ul>{''.join(links)}</ul></body></html>",
+        encoding="utf-8",
+    )
+    return {"reports": len(reports), "figures": len(jobs), "datasets": len(data)}
+
+
+def main():
+    from data_loader import load_data
+
+    parser = argparse.ArgumentParser(description="Export static HTML reports of the objective pages.")
+    parser.add_argument("out", help="directory for the reports")
+    parser.add_argument("--page", action="append", dest="pages", choices=list(PAGES), help="only this page (repeatable)")
+    parser.add_argument("--vary", action="append", help="only vary this filter, others stay on All (repeatable)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="render processes")
+    parser.add_argument("--standalone", action="store_true", help="embed plotly.js in every report")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = export_reports(load_data(), args.out, args.pages, args.vary, args.workers, args.standalone)
+    print(f"Wrote {stats['reports']} reports ({stats['figures']} distinct figures, {stats['datasets']} datasets) "
+          f"to {args.out} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
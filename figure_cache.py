@@ -0,0 +1,72 @@
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+# ---------------------------------------
+# FIGURE CACHE
+# ---------------------------------------
+# Every rerun used to rebuild every plotly figure on the page, even when the
+# widget that changed feeds only one chart. Figures are memoized here per
+# (chart id, dataset version, filter values) and shared by all sessions of
+# the process; the least recently used ones are evicted once their
+# serialized JSON exceeds the memory budget.
+#
+# Cached figures are shared: build() must apply every update_layout /
+# update_traces itself, and callers only pass the result to st.plotly_chart
+# (which serializes a copy and never modifies it).
+
+MAX_BYTES = int(float(os.environ.get("EDUTRACK_FIGURE_CACHE_MB", "64")) * 1024 * 1024)
+
+_figures = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+
+def _freeze(value):
+    # Multiselect lists and slider tuples become hashable key parts
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def cached_figure(chart_id, version, build, **filters):
+    """Figure for ``chart_id`` under ``filters``, calling ``build()`` only on a miss.
+
+    ``version`` identifies the dataset (see data_loader.data_version) so a new
+    upload never serves figures drawn from the old rows.
+    """
+    key = (chart_id, version, _freeze(filters))
+    with _lock:
+        if key in _figures:
+            _figures.move_to_end(key)
+            _stats["hits"] += 1
+            return _figures[key][0]
+        _stats["misses"] += 1
+
+    fig = build()
+    size = len(pio.to_json(fig, validate=False))
+
+    with _lock:
+        if key not in _figures and size <= MAX_BYTES:
+            _figures[key] = (fig, size)
+            _stats["bytes"] += size
+            while _stats["bytes"] > MAX_BYTES:
+                _, (_, old_size) = _figures.popitem(last=False)
+                _stats["bytes"] -= old_size
+                _stats["evictions"] += 1
+    return fig
+
+
+def cache_info():
+    with _lock:
+        return {**_stats, "figures": len(_figures), "max_bytes": MAX_BYTES}
+
+
+def clear():
+    with _lock:
+        _figures.clear()
+        _stats["bytes"] = 0
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import base64
+from live_feed import get_live_feed
 
 # ---------------------------------------
 # CUSTOM CSS (UMK THEME)
@@ -113,13 +114,10 @@ with tab2:
     st.markdown('<h2 class="section-title">📊 Homepage Analytics Overview</h2>', unsafe_allow_html=True)
     st.caption("Automatically updated from Google Forms")
 
-    # Load Google Sheets CSV
-    sheet_url = (
-        "https://docs.google.com/spreadsheets/d/"
-        "1IVXi1nQYuM_tQolHWv6asvttHkbDRWpSW20VuSptEvw/export?format=csv"
-    )
-    df = pd.read_csv(sheet_url)
-    total_responses = len(df)
+    # Live Google Sheets feed: only rows newer than the last refresh are parsed
+    feed = get_live_feed()
+    feed.refresh()
+    total_responses = feed.total_responses
 
     # ---------------------------------------
     # KPI METRICS
@@ -129,31 +127,9 @@ with tab2:
     col1, col2, col3, col4 = st.columns(4)
 
     col1.metric("👥 Total Students", total_responses)
-    col2.metric("📋 Survey Items", len(df.columns))
-
-    if "Faculty" in df.columns:
-        faculties_count = (
-            df["Faculty"]
-            .astype(str)
-            .str.strip()
-            .replace("nan", None)
-            .dropna()
-            .nunique()
-        )
-    elif "Faculty_Short" in df.columns:
-        faculties_count = (
-            df["Faculty_Short"]
-            .astype(str)
-            .str.strip()
-            .replace("nan", None)
-            .dropna()
-            .nunique()
-        )
-    else:
-        faculties_count = "-"
-
-    col3.metric("🎓 UMK Faculties", faculties_count)
-    col4.metric("📅 Latest Response", "Live")
+    col2.metric("📋 Survey Items", len(feed.columns))
+    col3.metric("🎓 UMK Faculties", feed.faculties_count)
+    col4.metric("📅 Latest Response", feed.latest_response)
 
     st.progress(min(total_responses / 100, 1.0))
     st.caption("Progress: Target 100 UMK students")
@@ -166,9 +142,9 @@ with tab2:
     st.markdown("### 👤 Demographics Snapshot")
     demo_col = st.selectbox(
         "Select a demographic variable:",
-        df.columns[2:5]
+        feed.columns[2:5]
     )
-    demo_counts = df[demo_col].value_counts()
+    demo_counts = feed.value_counts(demo_col)
     st.bar_chart(demo_counts)
     st.caption(f"Distribution of UMK students by **{demo_col}**")
 
@@ -180,9 +156,9 @@ with tab2:
     st.markdown("### 📚 Study & Learning Trends")
     trend_col = st.selectbox(
         "Select a learning-related question:",
-        df.columns[5:10] if len(df.columns) > 10 else df.columns
+        feed.columns[5:10] if len(feed.columns) > 10 else feed.columns
     )
-    trend_counts = df[trend_col].value_counts()
+    trend_counts = feed.value_counts(trend_col)
     st.line_chart(trend_counts)
     st.caption(f"Trend analysis for **{trend_col}**")
 
@@ -210,6 +186,7 @@ with tab2:
     # ---------------------------------------
     # DATA EXPLORER
     # ---------------------------------------
+    df = feed.frame
     with st.expander("📄 View Full Dataset"):
         st.dataframe(df, use_container_width=True)
 
@@ -219,7 +196,7 @@ with tab2:
 
     st.download_button(
         "⬇️ Download Data (CSV)",
-        df.to_csv(index=False).encode("utf-8"),
+        feed.csv_bytes,
         "edutrack_umk_data.csv",
         "text/csv"
     )
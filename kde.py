@@ -0,0 +1,74 @@
+import numpy as np
+
+# ---------------------------------------
+# FFT KERNEL DENSITY ESTIMATES
+# ---------------------------------------
+# Gaussian KDE curves without scipy: each group's values are linearly
+# binned onto one shared grid, and the bin counts are convolved with the
+# Gaussian kernel as a product in the Fourier domain (the kernel's
+# transform is known in closed form). Cost is O(n + grid log grid) per
+# group instead of O(n x grid), and every group is transformed in one
+# batched rfft call. Bandwidths follow Silverman's rule of thumb.
+
+GRID_SIZE = 512
+
+
+def silverman_bandwidth(values):
+    """0.9 * min(std, IQR / 1.34) * n^(-1/5); falls back to std when IQR is 0."""
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n < 2:
+        return np.nan
+    std = values.std(ddof=1)
+    q75, q25 = np.percentile(values, [75, 25])
+    spread = min(std, (q75 - q25) / 1.34) if q75 > q25 else std
+    # Identical values leave only rounding noise in the spread
+    if spread <= 1e-12 * max(1.0, abs(values.mean())):
+        return np.nan
+    return 0.9 * spread * n ** -0.2
+
+
+def _linear_binning(values, lo, dx, size):
+    # Each value's weight is split between its two neighbouring grid points
+    pos = (values - lo) / dx
+    left = np.clip(np.floor(pos).astype(int), 0, size - 2)
+    frac = np.clip(pos - left, 0.0, 1.0)
+    return (
+        np.bincount(left, weights=1 - frac, minlength=size)
+        + np.bincount(left + 1, weights=frac, minlength=size)
+    )
+
+
+def kde_curves(groups, grid_size=GRID_SIZE, cut=3.0):
+    """Density curves for several groups of values on one shared grid.
+
+    ``groups`` maps a label to a 1-D array of values (NaNs are dropped).
+    Returns ``(grid, densities)`` where ``densities`` maps each label to
+    its density on ``grid``; groups with fewer than two distinct values
+    are left out.
+    """
+    samples, bandwidths = {}, {}
+    for label, values in groups.items():
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        bw = silverman_bandwidth(values)
+        if not np.isnan(bw):
+            samples[label], bandwidths[label] = values, bw
+    if not samples:
+        return np.array([]), {}
+
+    lo = min(v.min() - cut * bandwidths[k] for k, v in samples.items())
+    hi = max(v.max() + cut * bandwidths[k] for k, v in samples.items())
+    grid, dx = np.linspace(lo, hi, grid_size, retstep=True)
+
+    counts = np.vstack([_linear_binning(v, lo, dx, grid_size) for v in samples.values()])
+    # Zero padding to twice the grid keeps the circular convolution from wrapping
+    n_fft = 2 * grid_size
+    freqs = np.fft.rfftfreq(n_fft, d=dx)
+    bw = np.array(list(bandwidths.values()))[:, None]
+    kernel = np.exp(-0.5 * (2 * np.pi * freqs[None, :] * bw) ** 2)
+    smoothed = np.fft.irfft(np.fft.rfft(counts, n_fft, axis=1) * kernel, n_fft, axis=1)[:, :grid_size]
+
+    sizes = np.array([len(v) for v in samples.values()])[:, None]
+    densities = np.clip(smoothed, 0.0, None) / (sizes * dx)
+    return grid, dict(zip(samples, densities))
@@ -0,0 +1,213 @@
+from itertools import combinations, product
+
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------
+# PRE-AGGREGATED FILTER CUBE FOR KPI BLOCKS
+# ---------------------------------------
+# The "Key Summary Insights" blocks filter by up to three dimensions and
+# then take means, modes, maxima and a correlation of the filtered rows.
+# The cube computes, once per dataset, sufficient statistics for every
+# combination of dimension values including "All" rollups:
+#   count, per-measure non-null count / sum / sum of squares / min / max,
+#   per-pair n / sums / sums of squares / cross-product, and value counts
+#   for the mode columns.
+# Every KPI is then a dictionary lookup, independent of the row count.
+# Multi-value selections merge the cells of their values, which costs one
+# lookup per combination of selected values.
+
+ALL = "All"
+
+
+def selected_values(value):
+    """Values chosen by a filter widget, or None when it does not filter.
+
+    "All", None and an empty multiselect mean no filter; a single value is
+    treated as a one-element selection.
+    """
+    if value is None or (isinstance(value, str) and value == ALL):
+        return None
+    if isinstance(value, (list, tuple, set)):
+        return list(value) or None
+    return [value]
+
+
+def _merge(cells):
+    # Counts and sums add up; minima and maxima combine
+    if len(cells) == 1:
+        return cells[0]
+    merged = {}
+    for stats in cells:
+        for key, value in stats.items():
+            if key not in merged:
+                merged[key] = value
+            elif key.endswith("|min"):
+                merged[key] = min(merged[key], value)
+            elif key.endswith("|max"):
+                merged[key] = max(merged[key], value)
+            else:
+                merged[key] += value
+    return merged
+
+
+def _distinct_values(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return list(series.cat.categories)
+    return sorted(series.dropna().unique())
+
+
+class CubeCell:
+    """Sufficient statistics of one filter selection."""
+
+    def __init__(self, stats, mode_values):
+        self._stats = stats
+        self._mode_values = mode_values
+
+    def _get(self, key):
+        return self._stats.get(key, 0.0)
+
+    @property
+    def count(self):
+        return int(self._get("__rows__"))
+
+    @property
+    def empty(self):
+        return self.count == 0
+
+    def mean(self, col):
+        n = self._get(f"{col}|n")
+        return self._get(f"{col}|sum") / n if n else np.nan
+
+    def std(self, col):
+        n = self._get(f"{col}|n")
+        if n < 2:
+            return np.nan
+        var = (self._get(f"{col}|sumsq") - self._get(f"{col}|sum") ** 2 / n) / (n - 1)
+        return float(np.sqrt(max(var, 0.0)))
+
+    def min(self, col):
+        return self._stats.get(f"{col}|min", np.nan)
+
+    def max(self, col):
+        return self._stats.get(f"{col}|max", np.nan)
+
+    def corr(self, x, y):
+        """Pearson correlation over rows where both columns are present."""
+        key = f"{x}*{y}"
+        n = self._get(f"{key}|n")
+        if n < 2:
+            return np.nan
+        sx, sy = self._get(f"{key}|sx"), self._get(f"{key}|sy")
+        cov = self._get(f"{key}|sxy") - sx * sy / n
+        var_x = self._get(f"{key}|sxx") - sx * sx / n
+        var_y = self._get(f"{key}|syy") - sy * sy / n
+        # Constant columns leave only rounding noise in the variance
+        tol = 1e-12 * n
+        if var_x <= tol * max(1.0, (sx / n) ** 2) or var_y <= tol * max(1.0, (sy / n) ** 2):
+            return np.nan
+        return float(cov / np.sqrt(var_x * var_y))
+
+    def value_counts(self, col):
+        return {value: self._get(f"{col}=={i}") for i, value in enumerate(self._mode_values[col])}
+
+    def mode(self, col):
+        """Most frequent value (first in category order on ties), or None."""
+        counts = self.value_counts(col)
+        best = max(counts.values(), default=0)
+        if best == 0:
+            return None
+        return next(value for value, n in counts.items() if n == best)
+
+    def share(self, col, value):
+        return self.value_counts(col).get(value, 0) / self.count if self.count else np.nan
+
+
+class FilterCube:
+    def __init__(self, df, dims, measures=(), pairs=(), modes=()):
+        self.dims = list(dims)
+        self.measures = list(measures)
+        self.pairs = [tuple(p) for p in pairs]
+        self.modes = list(modes)
+        self.values = {dim: _distinct_values(df[dim]) for dim in self.dims}
+        self.mode_values = {col: _distinct_values(df[col]) for col in self.modes}
+        self._cells = {}
+        self._build(df)
+
+    # ---------------------------------------
+    # BUILD
+    # ---------------------------------------
+    def _build(self, df):
+        work = pd.DataFrame({dim: df[dim] for dim in self.dims})
+        additive, minimum, maximum = ["__rows__"], [], []
+        work["__rows__"] = 1.0
+
+        for col in self.measures:
+            values = df[col].astype(float)
+            work[f"{col}|n"] = values.notna().astype(float)
+            work[f"{col}|sum"] = values.fillna(0.0)
+            work[f"{col}|sumsq"] = values.fillna(0.0) ** 2
+            work[f"{col}|min"] = values
+            work[f"{col}|max"] = values
+            additive += [f"{col}|n", f"{col}|sum", f"{col}|sumsq"]
+            minimum.append(f"{col}|min")
+            maximum.append(f"{col}|max")
+
+        for x, y in self.pairs:
+            key = f"{x}*{y}"
+            xs, ys = df[x].astype(float), df[y].astype(float)
+            both = xs.notna() & ys.notna()
+            xs, ys = xs.where(both, 0.0), ys.where(both, 0.0)
+            for name, values in (("n", both.astype(float)), ("sx", xs), ("sy", ys),
+                                 ("sxx", xs * xs), ("syy", ys * ys), ("sxy", xs * ys)):
+                work[f"{key}|{name}"] = values
+                additive.append(f"{key}|{name}")
+
+        for col in self.modes:
+            for i, value in enumerate(self.mode_values[col]):
+                work[f"{col}=={i}"] = (df[col] == value).astype(float)
+                additive.append(f"{col}=={i}")
+
+        agg = {**{c: "sum" for c in additive}, **{c: "min" for c in minimum}, **{c: "max" for c in maximum}}
+
+        # Leaf cells come from the rows; every rollup comes from the leaves
+        leaves = work.groupby(self.dims, observed=True).agg(agg) if self.dims else work.agg(agg).to_frame().T
+        for r in range(len(self.dims) + 1):
+            for kept in combinations(self.dims, r):
+                if kept:
+                    table = leaves.groupby(level=list(kept), observed=True).agg(agg)
+                else:
+                    table = leaves.agg(agg).to_frame().T
+                    table.index = [()]
+                for key, row in zip(table.index, table.to_dict("records")):
+                    key = key if isinstance(key, tuple) else (key,)
+                    selection = dict(zip(kept, key))
+                    full_key = tuple(selection.get(dim, ALL) for dim in self.dims)
+                    self._cells[full_key] = {k: v for k, v in row.items() if not pd.isna(v)}
+
+    # ---------------------------------------
+    # LOOKUP
+    # ---------------------------------------
+    def cell(self, **selection):
+        """Statistics for ``dim=value`` selections; omitted dims mean "All".
+
+        A value may also be a list of values, selecting any of them.
+        """
+        choices = []
+        for dim in self.dims:
+            wanted = selected_values(selection.get(dim))
+            choices.append([ALL] if wanted is None else wanted)
+        cells = [self._cells[key] for key in product(*choices) if key in self._cells]
+        return CubeCell(_merge(cells) if cells else {}, self.mode_values)
+
+    def best(self, dim, col, **selection):
+        """Value of ``dim`` with the highest mean ``col`` within the selection."""
+        wanted = selected_values(selection.get(dim))
+        # In category order, so ties do not depend on the order of the clicks
+        candidates = [v for v in self.values[dim] if wanted is None or v in wanted]
+        best_value, best_mean = None, -np.inf
+        for value in candidates:
+            mean = self.cell(**{**selection, dim: value}).mean(col)
+            if not np.isnan(mean) and mean > best_mean:
+                best_value, best_mean = value, mean
+        return best_value
@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from startup_profile import lazy_module
+
+px = lazy_module("plotly.express")
+
+# ---------------------------------------
+# LEVEL-OF-DETAIL SCATTER RENDERING
+# ---------------------------------------
+# Row-level scatter and bubble charts draw one marker per student, so the
+# websocket payload and the browser's drawing time grow with the cohort.
+# The render mode is picked from the number of rows in the chart:
+#   svg     up to WEBGL_ROWS       one SVG marker per student
+#   webgl   up to BINNED_ROWS      one WebGL marker per student
+#   binned  above BINNED_ROWS      one WebGL marker per occupied cell, sized
+#                                  by the number of students it stands for
+# The mode and the number of points drawn are stored in the figure's
+# layout.meta so pages can report them with point_summary().
+
+WEBGL_ROWS = int(os.environ.get("EDUTRACK_LOD_WEBGL_ROWS", "1000"))
+BINNED_ROWS = int(os.environ.get("EDUTRACK_LOD_BINNED_ROWS", "50000"))
+GRID_BINS = 80
+
+
+def render_mode(n_rows):
+    if n_rows > BINNED_ROWS:
+        return "binned"
+    return "webgl" if n_rows > WEBGL_ROWS else "svg"
+
+
+def binned_points(df, x, y, bins=GRID_BINS):
+    """Occupied cells of a ``bins`` x ``bins`` grid over ``x`` and ``y``.
+
+    Each cell is placed at the mean position of its rows, so data that only
+    takes a few distinct values (range midpoints) is drawn exactly.
+    """
+    both = df[[x, y]].dropna()
+    xs, ys = both[x].to_numpy(dtype=float), both[y].to_numpy(dtype=float)
+    counts, x_edges, y_edges = np.histogram2d(xs, ys, bins=bins)
+    x_sums = np.histogram2d(xs, ys, bins=[x_edges, y_edges], weights=xs)[0]
+    y_sums = np.histogram2d(xs, ys, bins=[x_edges, y_edges], weights=ys)[0]
+    occupied = counts > 0
+    return pd.DataFrame({
+        x: x_sums[occupied] / counts[occupied],
+        y: y_sums[occupied] / counts[occupied],
+        "count": counts[occupied].astype(int),
+    })
+
+
+def _tag(fig, mode, rows, points):
+    fig.update_layout(meta={"lod_mode": mode, "rows": int(rows), "points": int(points)})
+    return fig
+
+
+def lod_scatter(df, x, y, **px_kwargs):
+    """px.scatter of ``x`` against ``y`` at the level of detail ``len(df)`` allows.
+
+    Trendlines are drawn separately (trendline.add_trendline) from a fit on
+    the rows, so they do not depend on the render mode.
+    """
+    rows = int(df[[x, y]].notna().all(axis=1).sum())
+    mode = render_mode(rows)
+    if mode != "binned":
+        fig = px.scatter(df, x=x, y=y, render_mode=mode, **px_kwargs)
+        return _tag(fig, mode, rows, rows)
+
+    points = binned_points(df, x, y)
+    fig = px.scatter(points, x=x, y=y, size="count", hover_data=["count"], render_mode="webgl", **px_kwargs)
+    return _tag(fig, mode, rows, len(points))
+
+
+def lod_bubble(df, x, y, size, **px_kwargs):
+    """px.scatter bubble chart; past BINNED_ROWS, identical bubbles are drawn once.
+
+    Students with the same ``x``, ``y`` and ``size`` values sit on the same
+    spot, so each distinct combination is drawn once, sized by its count;
+    ``size`` then moves to the hover (and stays on any colour mapping).
+    """
+    rows = len(df)
+    mode = render_mode(rows)
+    if mode != "binned":
+        fig = px.scatter(df, x=x, y=y, size=size, render_mode=mode, **px_kwargs)
+        return _tag(fig, mode, rows, rows)
+
+    points = df.groupby([x, y, size], observed=True).size().reset_index(name="count")
+    fig = px.scatter(points, x=x, y=y, size="count", hover_data=[size, "count"], render_mode="webgl", **px_kwargs)
+    return _tag(fig, mode, rows, len(points))
+
+
+def point_summary(fig):
+    """One-line description of what a level-of-detail figure draws."""
+    meta = fig.layout.meta or {}
+    rows, points = meta.get("rows", 0), meta.get("points", 0)
+    if meta.get("lod_mode") == "binned":
+        return f"Drawing {points:,} aggregated points for {rows:,} students (WebGL)."
+    renderer = "WebGL" if meta.get("lod_mode") == "webgl" else "SVG"
+    return f"Drawing {points:,} points, one per student ({renderer})."
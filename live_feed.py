@@ -0,0 +1,158 @@
+import hashlib
+import io
+import threading
+
+import pandas as pd
+import streamlit as st
+
+import dataset_cache
+from data_loader import SHEET_FALLBACK, SHEET_REVALIDATE_SECONDS, SHEET_URL
+from etl import TIMESTAMP_COLUMN, TIMESTAMP_FORMAT
+
+# ---------------------------------------
+# INCREMENTAL LIVE RESPONSE FEED (HOME PAGE)
+# ---------------------------------------
+# The Google Forms sheet only ever grows at the bottom. The feed remembers
+# how many bytes of the export it has ingested and a hash of them, so each
+# refresh parses only the new tail of the export and folds it into running
+# counters instead of recomputing from scratch. If earlier bytes change (a
+# response was edited or deleted) it rebuilds. Every byte past the offset is
+# a new response, whatever its Timestamp: the export has one-second
+# resolution, so the latest Timestamp (high-water mark) is only reported,
+# never used to filter. Tails are parsed with the dtypes of the first parse;
+# a tail that does not fit them (e.g. a blank in an integer column) rebuilds.
+
+
+def _faculty_values(chunk):
+    for col in ("Faculty", "Faculty_Short"):
+        if col in chunk.columns:
+            values = chunk[col].dropna().astype(str).str.strip()
+            return set(values[values != ""])
+    return None
+
+
+class LiveResponseFeed:
+    def __init__(self, url=SHEET_URL, name="survey_responses", fallback_path=SHEET_FALLBACK):
+        self.url = url
+        self.name = name
+        self.fallback_path = fallback_path
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self.columns = None
+        self.dtypes = None
+        self.high_water = None
+        self.total_responses = 0
+        self.faculties = None
+        self._chunks = []
+        self._counts = {}
+        self._version = None
+        self._offset = 0
+        self._prefix_sha1 = None
+        self._frame = None
+        self._csv = None
+
+    # ---------------------------------------
+    # INGESTION
+    # ---------------------------------------
+    def refresh(self):
+        """Fetch the export and ingest any rows added since the last call."""
+        with self._lock:
+            path, version, _ = dataset_cache.resolve(
+                self.url, self.name, fallback_path=self.fallback_path, max_age=SHEET_REVALIDATE_SECONDS
+            )
+            if version == self._version:
+                return 0
+
+            body = path.read_bytes()
+            if self._offset and (
+                len(body) < self._offset
+                or hashlib.sha1(body[:self._offset]).hexdigest() != self._prefix_sha1
+            ):
+                self._reset()
+
+            chunk = None
+            if self.columns is not None:
+                tail = body[self._offset:]
+                try:
+                    chunk = pd.read_csv(
+                        io.BytesIO(tail), header=None, names=self.columns, dtype=self.dtypes
+                    ) if tail.strip() else None
+                except (ValueError, TypeError):
+                    self._reset()
+            if self.columns is None:
+                chunk = pd.read_csv(io.BytesIO(body))
+                self.columns = list(chunk.columns)
+                self.dtypes = chunk.dtypes.to_dict()
+
+            added = self._ingest(chunk) if chunk is not None else 0
+            self._offset = len(body)
+            self._prefix_sha1 = hashlib.sha1(body).hexdigest()
+            self._version = version
+            return added
+
+    def _ingest(self, chunk):
+        if TIMESTAMP_COLUMN in chunk.columns:
+            stamps = pd.to_datetime(chunk[TIMESTAMP_COLUMN], format=TIMESTAMP_FORMAT, errors="coerce")
+            if stamps.notna().any():
+                latest = stamps.max()
+                self.high_water = latest if self.high_water is None else max(self.high_water, latest)
+        if chunk.empty:
+            return 0
+
+        self._chunks.append(chunk)
+        self.total_responses += len(chunk)
+
+        new_faculties = _faculty_values(chunk)
+        if new_faculties is not None:
+            self.faculties = (self.faculties or set()) | new_faculties
+
+        # Only columns somebody has asked about are kept up to date
+        for col, counts in self._counts.items():
+            self._counts[col] = counts.add(chunk[col].value_counts(), fill_value=0).astype(int)
+
+        self._frame = None
+        self._csv = None
+        return len(chunk)
+
+    # ---------------------------------------
+    # READ SIDE
+    # ---------------------------------------
+    @property
+    def faculties_count(self):
+        return len(self.faculties) if self.faculties is not None else "-"
+
+    @property
+    def latest_response(self):
+        return self.high_water.strftime("%d %b %Y, %H:%M") if self.high_water is not None else "Live"
+
+    def value_counts(self, col):
+        """Per-column value counts, maintained incrementally once requested."""
+        with self._lock:
+            if col not in self._counts:
+                self._counts[col] = self.frame[col].value_counts()
+            return self._counts[col].sort_values(ascending=False)
+
+    @property
+    def frame(self):
+        # Concatenated lazily and only again after new rows arrive
+        with self._lock:
+            if self._frame is None:
+                self._frame = (
+                    pd.concat(self._chunks, ignore_index=True)
+                    if self._chunks else pd.DataFrame(columns=self.columns)
+                )
+            return self._frame
+
+    @property
+    def csv_bytes(self):
+        with self._lock:
+            if self._csv is None:
+                self._csv = self.frame.to_csv(index=False).encode("utf-8")
+            return self._csv
+
+
+@st.cache_resource
+def get_live_feed():
+    return LiveResponseFeed()
@@ -1,5 +1,10 @@
 import streamlit as st
 
+# Imported first so the first-request timer starts with the app script
+import startup_profile
+import perf
+import profiling
+
 st.set_page_config(
     page_title="EduTrack Dashboard",
     layout="wide"
@@ -45,7 +50,17 @@ pg = st.navigation(
     }
 )
 
-pg.run()
-
+# EDUTRACK_PROFILE (or ?profile= with the admin token) profiles this rerun
+with profiling.capture(pg.url_path or "home"):
+    pg.run()
 
+# EDUTRACK_PERF=1 shows the page's per-section timings in the sidebar
+perf.panel()
 
+# EDUTRACK_STARTUP_PROFILE=1 logs the first request's latency and imports
+stats = startup_profile.first_request_done(pg.title)
+if startup_profile.ENABLED:
+    st.sidebar.caption(
+        f"First request: {stats['seconds']:.2f}s "
+        f"(budget {stats['budget_seconds']:.1f}s), {stats['modules_imported']} modules imported"
+    )
@@ -1,6 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import analytics
+import charts
+from data_loader import data_version, load_cube, load_data
+from figure_cache import cached_figure
+import perf
 
 # ---------------------------------------
 # PAGE CONFIG
@@ -10,15 +14,6 @@ st.set_page_config(
     layout="wide"
 )
 
-# ---------------------------------------
-# HELPER FUNCTION (From Friend's Style)
-# ---------------------------------------
-def sort_by_lower_bound(value):
-    try:
-        return float(value.split("-")[0].strip().replace("%", ""))
-    except:
-        return 0
-
 #---------------------------------------
 # TITLE & OVERVIEW
 #---------------------------------------
@@ -36,8 +31,15 @@ st.markdown("---")
 # ---------------------------------------
 # LOAD DATA
 # ---------------------------------------
-url = "https://raw.githubusercontent.com/nrhdyh/EduTrack/refs/heads/main/cleaned_student_performance_ver2.csv"
-df = pd.read_csv(url)
+# Only the columns this page uses are read from the Parquet snapshot
+COLUMNS = [
+    "Learning_Mode", "Year_of_Study", "Faculty_Short", "Gender",
+    "GPA_Midpoint", "CGPA_Midpoint",
+]
+df = load_data(COLUMNS)
+version = data_version()
+# Per-section data / figure / send timings (EDUTRACK_PERF=1)
+timer = perf.timer("objective3")
 
 # =====================================================
 # 📊 SUMMARY INSIGHT BLOCK BOXES
@@ -47,38 +49,38 @@ st.subheader("📊 Key Summary Insights")
 # Filters (Using Friend's Column Logic)
 col_f1, col_f2, col_f3 = st.columns(3)
 
+# Leaving a filter empty means "All"
 with col_f1:
-    selected_year = st.selectbox(
+    selected_year = st.multiselect(
         "Filter by Year of Study",
-        ["All"] + sorted(df["Year_of_Study"].dropna().unique().tolist())
+        list(df["Year_of_Study"].cat.categories),
+        placeholder="All"
     )
 
 with col_f2:
-    selected_faculty = st.selectbox(
+    selected_faculty = st.multiselect(
         "Filter by Faculty",
-        ["All"] + sorted(df["Faculty_Short"].dropna().unique().tolist())
+        list(df["Faculty_Short"].cat.categories),
+        placeholder="All"
     )
 
 with col_f3:
-    selected_gender = st.selectbox(
+    selected_gender = st.multiselect(
         "Filter by Gender",
-        ["All"] + sorted(df["Gender"].dropna().unique().tolist())
+        list(df["Gender"].cat.categories),
+        placeholder="All"
     )
 
-# Apply filters
-filtered_df = df.copy()
-if selected_year != "All":
-    filtered_df = filtered_df[filtered_df["Year_of_Study"] == selected_year]
-if selected_faculty != "All":
-    filtered_df = filtered_df[filtered_df["Faculty_Short"] == selected_faculty]
-if selected_gender != "All":
-    filtered_df = filtered_df[filtered_df["Gender"] == selected_gender]
+# Look up the filter selection in the pre-aggregated KPI cube
+with timer("KPIs", "data"):
+    kpi_cube = load_cube(version, COLUMNS, **analytics.OBJECTIVE3_CUBE)
+    kpis = analytics.objective3_kpis(kpi_cube, year=selected_year, faculty=selected_faculty, gender=selected_gender)
 
 # Compute metrics for Objective 3
-avg_gpa = filtered_df["GPA_Midpoint"].mean() if not filtered_df.empty else 0
-dominant_mode = filtered_df["Learning_Mode"].mode()[0] if not filtered_df.empty else "N/A"
-max_cgpa = filtered_df["CGPA_Midpoint"].max() if not filtered_df.empty else 0
-total_count = len(filtered_df)
+avg_gpa = kpis["avg_gpa"]
+dominant_mode = kpis["dominant_mode"]
+max_cgpa = kpis["max_cgpa"]
+total_count = kpis["students"]
 
 # Define the block style (Friend's Purple/Indigo Gradient)
 block_style = """
@@ -111,163 +113,197 @@ st.subheader("📄 Dataset Preview")
 st.dataframe(df.head())
 st.markdown("---")
 
+# Each numbered section is a fragment (perf.PageTimer.fragment): its own
+# widgets rerun that section only, the filters above rerun the page.
+
 # =====================================================
 # 1️⃣ Pie Chart: Learning Mode Distribution
 # =====================================================
-st.markdown(f'<div style="{block_style}"><h3>1️⃣ Learning Mode Preference Distribution</h3></div>', unsafe_allow_html=True)
+@timer.fragment
+def mode_share_section():
+    st.markdown(f'<div style="{block_style}"><h3>1️⃣ Learning Mode Preference Distribution</h3></div>', unsafe_allow_html=True)
 
-fig1 = px.pie(
-    df, names='Learning_Mode', hole=0.4, 
-    color_discrete_sequence=px.colors.qualitative.Pastel,
-    title="Distribution of Preferred Learning Modes"
-)
-st.plotly_chart(fig1, use_container_width=True)
+    with timer("1. Mode share", "figure"):
+        fig1 = cached_figure("objective3/learning_mode_pie", version, lambda: charts.learning_mode_pie(
+            timer.call("1. Mode share", "data", analytics.mode_counts, df)
+        ))
+    with timer("1. Mode share", "send"):
+        st.plotly_chart(fig1, use_container_width=True)
+
+    st.markdown("### 📌 Interpretation & Analysis")
+    if st.checkbox("Show interpretation", value=True, key="interpret1"):
+        st.markdown("""
+    **What the graph shows:**  
+    The pie chart shows how UMK students prefer different learning modes, namely Hybrid, Offline, and Online learning.
 
-st.markdown("### 📌 Interpretation & Analysis")
-if st.checkbox("Show interpretation", value=True, key="interpret1"):
-    st.markdown("""
-**What the graph shows:**  
-The pie chart shows how UMK students prefer different learning modes, namely Hybrid, Offline, and Online learning.
+    **Analysis:**  
+    The results indicate that Hybrid learning is the most preferred mode, with more than half of the students selecting this option. This suggests that students value the flexibility of online components while still appreciating face-to-face interaction. Offline learning remains the second most preferred mode, indicating that traditional classroom learning is still important. In contrast, Online learning is the least preferred option, showing that fully remote learning is less favoured among students.
 
-**Analysis:**  
-The results indicate that Hybrid learning is the most preferred mode, with more than half of the students selecting this option. This suggests that students value the flexibility of online components while still appreciating face-to-face interaction. Offline learning remains the second most preferred mode, indicating that traditional classroom learning is still important. In contrast, Online learning is the least preferred option, showing that fully remote learning is less favoured among students.
+    **Why this matters:**  
+    These findings highlight students’ preference for a balanced learning approach rather than fully online or fully physical modes. This insight is important for academic planning, as it suggests that hybrid learning should be prioritised to better align with students’ learning needs and preferences.
+        """)
 
-**Why this matters:**  
-These findings highlight students’ preference for a balanced learning approach rather than fully online or fully physical modes. This insight is important for academic planning, as it suggests that hybrid learning should be prioritised to better align with students’ learning needs and preferences.
-    """)
+
+mode_share_section()
 
 st.markdown("---")
 
+
 # =====================================================
 # 2️⃣ Bar Chart: Average GPA by Learning Mode (UPDATED)
 # =====================================================
-st.markdown(f'<div style="{block_style}"><h3>2️⃣ Bar Chart: Average GPA by Learning Mode</h3></div>', unsafe_allow_html=True)
+@timer.fragment
+def gpa_by_mode_section():
+    st.markdown(f'<div style="{block_style}"><h3>2️⃣ Bar Chart: Average GPA by Learning Mode</h3></div>', unsafe_allow_html=True)
 
-# Calculation for GPA instead of CGPA
-avg_gpa_data = df.groupby('Learning_Mode')['GPA_Midpoint'].mean().reset_index()
+    # Calculation for GPA instead of CGPA
+    with timer("2. GPA by mode", "data"):
+        avg_gpa_data = analytics.gpa_by_mode(df)
 
-fig2 = px.bar(
-    avg_gpa_data, x='Learning_Mode', y='GPA_Midpoint', 
-    text_auto='.2f', 
-    color_discrete_sequence=px.colors.sequential.Viridis,
-    title="Comparison of Mean GPA Across Learning Modes"
-)
-st.plotly_chart(fig2, use_container_width=True)
+    with timer("2. GPA by mode", "figure"):
+        fig2 = cached_figure("objective3/gpa_by_mode_bar", version, lambda: charts.gpa_by_mode_bar(avg_gpa_data))
+    with timer("2. GPA by mode", "send"):
+        st.plotly_chart(fig2, use_container_width=True)
 
-st.markdown("### 📊 Summary Statistics")
-if st.checkbox("Show performance stats", value=True, key="stats2"):
-    st.dataframe(avg_gpa_data, use_container_width=True)
+    st.markdown("### 📊 Summary Statistics")
+    if st.checkbox("Show performance stats", value=True, key="stats2"):
+        with timer("2. GPA by mode", "send"):
+            st.dataframe(avg_gpa_data, use_container_width=True)
 
-st.markdown("### 📈 Performance Interpretation")
-if st.checkbox("Show performance interpretation", value=True, key="desc2"):
-    st.markdown("""
-**What the graph shows:**  
-The bar chart compares the average GPA of UMK students across different learning modes, namely Offline, Hybrid, and Online learning.
+    st.markdown("### 📈 Performance Interpretation")
+    if st.checkbox("Show performance interpretation", value=True, key="desc2"):
+        st.markdown("""
+    **What the graph shows:**  
+    The bar chart compares the average GPA of UMK students across different learning modes, namely Offline, Hybrid, and Online learning.
 
-**Analysis:**  
-The results indicate that the average GPA is very similar across all learning modes, remaining around 3.4. Offline learning shows a slightly higher average GPA, which may be due to direct interaction with lecturers and peers. However, the differences are minimal, suggesting that students can achieve comparable academic performance regardless of the learning mode.
+    **Analysis:**  
+    The results indicate that the average GPA is very similar across all learning modes, remaining around 3.4. Offline learning shows a slightly higher average GPA, which may be due to direct interaction with lecturers and peers. However, the differences are minimal, suggesting that students can achieve comparable academic performance regardless of the learning mode.
 
-**Why this matters:**  
-This finding shows that learning mode alone does not significantly influence academic performance. It highlights students’ adaptability and supports the use of flexible learning approaches, such as hybrid learning, without negatively affecting academic outcomes.
-    """)
+    **Why this matters:**  
+    This finding shows that learning mode alone does not significantly influence academic performance. It highlights students’ adaptability and supports the use of flexible learning approaches, such as hybrid learning, without negatively affecting academic outcomes.
+        """)
+
+
+gpa_by_mode_section()
 
 st.markdown("---")
 
+
 # =====================================================
 # 3️⃣ Box Plot: CGPA Variability
 # =====================================================
-st.markdown(f'<div style="{block_style}"><h3>3️⃣ Box Plot: CGPA Distribution by Learning Mode</h3></div>', unsafe_allow_html=True)
+@timer.fragment
+def cgpa_spread_section():
+    st.markdown(f'<div style="{block_style}"><h3>3️⃣ Box Plot: CGPA Distribution by Learning Mode</h3></div>', unsafe_allow_html=True)
 
-fig3 = px.box(
-    df, x='Learning_Mode', y='CGPA_Midpoint',
-    color_discrete_sequence=px.colors.sequential.Viridis,
-    title="CGPA Variability and Spread per Learning Mode"
-)
-st.plotly_chart(fig3, use_container_width=True)
+    with timer("3. CGPA spread", "figure"):
+        fig3 = cached_figure("objective3/cgpa_by_mode_box", version, lambda: charts.cgpa_by_mode_box(
+            timer.call("3. CGPA spread", "data", analytics.cgpa_by_mode_box, df)
+        ))
+    with timer("3. CGPA spread", "send"):
+        st.plotly_chart(fig3, use_container_width=True)
+
+    st.markdown("### 📊 Summary Statistics")
+    if st.checkbox("Show variability stats", value=True, key="stats3"):
+        with timer("3. CGPA spread", "data"):
+            variability_stats = analytics.cgpa_by_mode_spread(df)
+        with timer("3. CGPA spread", "send"):
+            st.dataframe(variability_stats, use_container_width=True)
+
+    st.markdown("### 📈 Variability Interpretation")
+    if st.checkbox("Show variability interpretation", value=True, key="desc3"):
+        st.markdown("""
+    **What the graph shows:**  
+    The box plot displays the distribution and variability of CGPA across different learning modes, including Offline, Hybrid, and Online learning.
 
-st.markdown("### 📊 Summary Statistics")
-if st.checkbox("Show variability stats", value=True, key="stats3"):
-    variability_stats = df.groupby("Learning_Mode")["CGPA_Midpoint"].agg(["min", "median", "max", "std"]).reset_index()
-    st.dataframe(variability_stats, use_container_width=True)
+    **Analysis:**  
+    The median CGPA remains relatively similar across all learning modes, indicating consistent overall performance. However, Offline learning shows a wider spread of CGPA values, suggesting greater variation in student performance. Hybrid and Online learning display more clustered results, with Hybrid learning showing the most consistent performance and fewer extreme values.
 
-st.markdown("### 📈 Variability Interpretation")
-if st.checkbox("Show variability interpretation", value=True, key="desc3"):
-    st.markdown("""
-**What the graph shows:**  
-The box plot displays the distribution and variability of CGPA across different learning modes, including Offline, Hybrid, and Online learning.
+    **Why this matters:**  
+    These results suggest that Hybrid learning offers a more stable and predictable environment for most students. Although Offline learning can lead to very high academic achievement for some students, its wider performance range may indicate uneven outcomes compared to the more consistent results seen in Hybrid learning.
+        """)
 
-**Analysis:**  
-The median CGPA remains relatively similar across all learning modes, indicating consistent overall performance. However, Offline learning shows a wider spread of CGPA values, suggesting greater variation in student performance. Hybrid and Online learning display more clustered results, with Hybrid learning showing the most consistent performance and fewer extreme values.
 
-**Why this matters:**  
-These results suggest that Hybrid learning offers a more stable and predictable environment for most students. Although Offline learning can lead to very high academic achievement for some students, its wider performance range may indicate uneven outcomes compared to the more consistent results seen in Hybrid learning.
-    """)
+cgpa_spread_section()
 
 st.markdown("---")
 
+
 # =====================================================
 # 4️⃣ Stacked Bar: Mode by Year (Dropdown Filter)
 # =====================================================
-st.markdown(f'<div style="{block_style}"><h3>4️⃣ Stacked Bar: Mode Preference by Year of Study</h3></div>', unsafe_allow_html=True)
+@timer.fragment
+def mode_by_year_section():
+    st.markdown(f'<div style="{block_style}"><h3>4️⃣ Stacked Bar: Mode Preference by Year of Study</h3></div>', unsafe_allow_html=True)
 
-# Using Friend's Dropdown Pattern
-year_opts = sorted(df["Year_of_Study"].dropna().unique())
-selected_year_chart = st.selectbox("Select Year of Study to Focus", ["All"] + list(year_opts))
+    # Using Friend's Dropdown Pattern
+    year_opts = list(df["Year_of_Study"].cat.categories)
+    selected_year_chart = st.selectbox("Select Year of Study to Focus", ["All"] + list(year_opts))
 
-chart_df = df if selected_year_chart == "All" else df[df["Year_of_Study"] == selected_year_chart]
+    with timer("4. Mode by year", "data"):
+        chart_df = df if selected_year_chart == "All" else df[df["Year_of_Study"] == selected_year_chart]
 
-fig4 = px.histogram(
-    chart_df, x='Year_of_Study', color='Learning_Mode', 
-    barmode='stack', color_discrete_sequence=px.colors.qualitative.Set2,
-    title=f"Learning Mode Distribution: {selected_year_chart}"
-)
-st.plotly_chart(fig4, use_container_width=True)
+    with timer("4. Mode by year", "figure"):
+        fig4 = cached_figure("objective3/mode_by_year_bar", version, lambda: charts.mode_by_year_bar(
+            timer.call("4. Mode by year", "data", analytics.mode_by_year, chart_df), selected_year_chart
+        ), year=selected_year_chart)
+    with timer("4. Mode by year", "send"):
+        st.plotly_chart(fig4, use_container_width=True)
+
+    st.markdown("### 📈 Yearly Preference Interpretation")
+    if st.checkbox("Show yearly interpretation", value=True, key="desc4"):
+        st.markdown("""
+    **What the graph shows:**  
+    This stacked bar chart illustrates the distribution of learning mode preferences across different years of study at UMK.
 
-st.markdown("### 📈 Yearly Preference Interpretation")
-if st.checkbox("Show yearly interpretation", value=True, key="desc4"):
-    st.markdown("""
-**What the graph shows:**  
-This stacked bar chart illustrates the distribution of learning mode preferences across different years of study at UMK.
+    **Analysis:**  
+    Year 1 students show a higher reliance on Offline and Hybrid learning as they establish their academic foundation and adapt to university life. As students progress to Year 3 and Year 4, there is a noticeable increase in preference for Hybrid learning. This likely reflects the need for greater flexibility to manage advanced coursework, final-year projects, and internships. Across all years, Online learning remains a smaller but consistent option.
 
-**Analysis:**  
-Year 1 students show a higher reliance on Offline and Hybrid learning as they establish their academic foundation and adapt to university life. As students progress to Year 3 and Year 4, there is a noticeable increase in preference for Hybrid learning. This likely reflects the need for greater flexibility to manage advanced coursework, final-year projects, and internships. Across all years, Online learning remains a smaller but consistent option.
+    **Why this matters:**  
+    These patterns highlight how students’ learning needs evolve over time. The findings suggest that hybrid learning models are particularly effective for senior students who require flexibility while still benefiting from structured academic support.
+        """)
+
+
+mode_by_year_section()
 
-**Why this matters:**  
-These patterns highlight how students’ learning needs evolve over time. The findings suggest that hybrid learning models are particularly effective for senior students who require flexibility while still benefiting from structured academic support.
-    """)
 st.markdown("---")
 
+
 # =====================================================
 # 5️⃣ Heatmap: Success Matrix
 # =====================================================
-st.markdown(f'<div style="{block_style}"><h3>5️⃣ Heatmap: Average CGPA Success Matrix</h3></div>', unsafe_allow_html=True)
+@timer.fragment
+def success_matrix_section():
+    st.markdown(f'<div style="{block_style}"><h3>5️⃣ Heatmap: Average CGPA Success Matrix</h3></div>', unsafe_allow_html=True)
 
-heatmap_data = df.groupby(['Learning_Mode', 'Year_of_Study'])['CGPA_Midpoint'].mean().reset_index()
+    with timer("5. Success matrix", "data"):
+        heatmap_data = analytics.success_matrix(df)
 
-fig5 = px.density_heatmap(
-    heatmap_data, x='Year_of_Study', y='Learning_Mode', z='CGPA_Midpoint',
-    text_auto=".2f", color_continuous_scale="Viridis",
-    labels={'CGPA_Midpoint': 'Avg CGPA'},
-    title="Success Matrix: Year vs. Mode"
-)
-st.plotly_chart(fig5, use_container_width=True)
+    with timer("5. Success matrix", "figure"):
+        fig5 = cached_figure("objective3/success_matrix", version, lambda: charts.success_matrix_heatmap(heatmap_data))
+    with timer("5. Success matrix", "send"):
+        st.plotly_chart(fig5, use_container_width=True)
+
+    st.markdown("### 📊 Summary Statistics")
+    if st.checkbox("Show heatmap stats", value=True, key="stats5"):
+        with timer("5. Success matrix", "send"):
+            st.dataframe(heatmap_data, use_container_width=True)
+
+    st.markdown("### 📈 Performance Risk Interpretation")
+    if st.checkbox("Show heatmap interpretation", value=True, key="desc5"):
+        st.markdown("""
+    **What the graph shows:**  
+    This heatmap displays the average CGPA across different learning modes and years of study, with colour intensity representing performance levels.
 
-st.markdown("### 📊 Summary Statistics")
-if st.checkbox("Show heatmap stats", value=True, key="stats5"):
-    st.dataframe(heatmap_data, use_container_width=True)
+    **Analysis:**  
+    The highest academic performance is observed among Year 1 students in Offline learning, highlighting the importance of physical classroom engagement for new students. Year 2 students in Hybrid and Online learning also show strong academic performance. In contrast, Year 4 students in Online learning record the lowest average CGPA, indicating a potential decline in performance at higher academic levels when learning is fully online.
 
-st.markdown("### 📈 Performance Risk Interpretation")
-if st.checkbox("Show heatmap interpretation", value=True, key="desc5"):
-    st.markdown("""
-**What the graph shows:**  
-This heatmap displays the average CGPA across different learning modes and years of study, with colour intensity representing performance levels.
+    **Why this matters:**  
+    These findings point to potential academic risks for senior students in fully online learning environments. As academic demands increase, students may require more structured guidance and interaction, suggesting that hybrid or offline learning models may better support academic success in later years.
+        """)
 
-**Analysis:**  
-The highest academic performance is observed among Year 1 students in Offline learning, highlighting the importance of physical classroom engagement for new students. Year 2 students in Hybrid and Online learning also show strong academic performance. In contrast, Year 4 students in Online learning record the lowest average CGPA, indicating a potential decline in performance at higher academic levels when learning is fully online.
 
-**Why this matters:**  
-These findings point to potential academic risks for senior students in fully online learning environments. As academic demands increase, students may require more structured guidance and interaction, suggesting that hybrid or offline learning models may better support academic success in later years.
-    """)
+success_matrix_section()
 
 st.markdown("---")
 st.caption("Developed for UMK Educational Analytics Dashboard.")
@@ -1,7 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.figure_factory as ff
+from data_loader import data_version, load_cube, load_data, load_index
+from figure_cache import cached_figure
+import perf
+import analytics
+import charts
 
 # ---------------------------------------
 # PAGE CONFIG
@@ -14,12 +17,16 @@ st.set_page_config(
 # ---------------------------------------
 # LOAD DATA
 # ---------------------------------------
-@st.cache_data
-def load_data():
-    url = "https://raw.githubusercontent.com/nrhdyh/EduTrack/refs/heads/main/cleaned_student_performance_ver2.csv"
-    return pd.read_csv(url)
-
-df = load_data()
+# Only the columns this page uses are read from the Parquet snapshot
+COLUMNS = [
+    "Year_of_Study", "Skill_Development_Hours_Category",
+    "Co_Curriculum_Activities_Text", "Skills_Category", "CGPA",
+    "GPA_Midpoint", "CGPA_Midpoint",
+]
+df = load_data(COLUMNS)
+version = data_version()
+# Per-section data / figure / send timings (EDUTRACK_PERF=1)
+timer = perf.timer("objective4")
 
 # ---------------------------------------
 # THEME STYLE (SOFT BLUE–PURPLE)
@@ -94,27 +101,38 @@ st.subheader("🔍 Dashboard Filters")
 
 c1, c2, c3 = st.columns(3)
 with c1:
-    year = st.selectbox("Year of Study", ["All"] + sorted(df["Year_of_Study"].dropna().unique()))
+    year = st.multiselect("Year of Study", list(df["Year_of_Study"].cat.categories), placeholder="All")
 with c2:
-    skill = st.selectbox("Skill Development Level", ["All"] + sorted(df["Skill_Development_Hours_Category"].dropna().unique()))
+    skill = st.selectbox("Skill Development Level", ["All"] + list(df["Skill_Development_Hours_Category"].cat.categories))
 with c3:
-    cocur = st.selectbox("Co-Curricular Participation", ["All"] + sorted(df["Co_Curriculum_Activities_Text"].dropna().unique()))
-
-filtered_df = df.copy()
-if year != "All":
-    filtered_df = filtered_df[filtered_df["Year_of_Study"] == year]
-if skill != "All":
-    filtered_df = filtered_df[filtered_df["Skill_Development_Hours_Category"] == skill]
-if cocur != "All":
-    filtered_df = filtered_df[filtered_df["Co_Curriculum_Activities_Text"] == cocur]
+    cocur = st.selectbox("Co-Curricular Participation", ["All"] + list(df["Co_Curriculum_Activities_Text"].cat.categories))
+
+# Resolve the filters on the bitmap index and take the matching rows once
+with timer("Filters", "data"):
+    filter_index = load_index(
+        version, COLUMNS,
+        dims=("Year_of_Study", "Skill_Development_Hours_Category", "Co_Curriculum_Activities_Text"),
+    )
+    filtered_df = filter_index.take(
+        df,
+        Year_of_Study=year,
+        Skill_Development_Hours_Category=skill,
+        Co_Curriculum_Activities_Text=cocur,
+    )
+# Every chart below depends on these filters only
+filters = dict(year=year, skill=skill, cocur=cocur)
 
 # =====================================================
 # 📊 KPI SUMMARY
 # =====================================================
-avg_gpa = filtered_df["GPA_Midpoint"].mean()
-avg_cgpa = filtered_df["CGPA_Midpoint"].mean()
-total_students = len(filtered_df)
-active_rate = (filtered_df["Co_Curriculum_Activities_Text"] == "Yes").mean() * 100
+with timer("KPIs", "data"):
+    kpi_cube = load_cube(version, COLUMNS, **analytics.OBJECTIVE4_CUBE)
+    kpis = analytics.objective4_kpis(kpi_cube, **filters)
+
+avg_gpa = kpis["avg_gpa"]
+avg_cgpa = kpis["avg_cgpa"]
+total_students = kpis["students"]
+active_rate = kpis["active_rate"]
 
 k1, k2, k3, k4 = st.columns(4)
 with k1:
@@ -133,17 +151,12 @@ st.markdown("---")
 # =====================================================
 st.markdown(f'<div style="{block_style}"><h3>1️⃣ CGPA Density: Active vs Non-Active Students</h3></div>', unsafe_allow_html=True)
 
-active = filtered_df[filtered_df['Co_Curriculum_Activities_Text'] == 'Yes']['CGPA_Midpoint'].dropna()
-inactive = filtered_df[filtered_df['Co_Curriculum_Activities_Text'] == 'No']['CGPA_Midpoint'].dropna()
-
-fig1 = ff.create_distplot(
-    [active, inactive],
-    ['Active Students', 'Non-Active Students'],
-    show_hist=False,
-    show_rug=False,
-    colors=['#667eea', '#764ba2']
-)
-st.plotly_chart(fig1, use_container_width=True)
+with timer("1. CGPA density", "figure"):
+    fig1 = cached_figure("objective4/cgpa_density", version, lambda: charts.cgpa_density(
+        timer.call("1. CGPA density", "data", analytics.cgpa_density, filtered_df)
+    ), **filters)
+with timer("1. CGPA density", "send"):
+    st.plotly_chart(fig1, use_container_width=True)
 
 st.markdown(f"""
 <div style="{interpretation_style}">
@@ -172,19 +185,13 @@ fluctuation, even if their average CGPA appears acceptable.
 # =====================================================
 st.markdown(f'<div style="{block_style}"><h3>2️⃣ Average CGPA by Skill Development & Co-Curricular</h3></div>', unsafe_allow_html=True)
 
-grouped = filtered_df.groupby(
-    ['Skill_Development_Hours_Category', 'Co_Curriculum_Activities_Text']
-)['CGPA_Midpoint'].mean().reset_index()
-
-fig2 = px.bar(
-    grouped,
-    x='Skill_Development_Hours_Category',
-    y='CGPA_Midpoint',
-    color='Co_Curriculum_Activities_Text',
-    barmode='group',
-    color_discrete_sequence=px.colors.qualitative.Pastel
-)
-st.plotly_chart(fig2, use_container_width=True)
+with timer("2. Skill x co-curricular", "data"):
+    grouped = analytics.cgpa_by_skill_cocur(filtered_df)
+
+with timer("2. Skill x co-curricular", "figure"):
+    fig2 = cached_figure("objective4/skill_cocurricular_bar", version, lambda: charts.skill_cocurricular_bar(grouped), **filters)
+with timer("2. Skill x co-curricular", "send"):
+    st.plotly_chart(fig2, use_container_width=True)
 
 st.markdown(f"""
 <div style="{interpretation_style}">
@@ -212,29 +219,14 @@ capacity
 # =====================================================
 st.markdown(f'<div style="{block_style}"><h3>3️⃣ CGPA Distribution by Skills Category</h3></div>', unsafe_allow_html=True)
 
-cgpa_order = ['2.50 – 2.99', '3.00 – 3.69', '3.70 - 4.00']
+with timer("3. Skills CGPA share", "data"):
+    percentage = analytics.skills_cgpa_share(filtered_df)
 
-cross_tab = pd.crosstab(filtered_df['Skills_Category'], filtered_df['CGPA'])
-cross_tab = cross_tab[[c for c in cgpa_order if c in cross_tab.columns]]
+with timer("3. Skills CGPA share", "figure"):
+    fig3 = cached_figure("objective4/skills_cgpa_share", version, lambda: charts.skills_cgpa_share(percentage), **filters)
 
-percentage = cross_tab.div(cross_tab.sum(axis=1), axis=0) * 100
-percentage = percentage.reset_index().melt(
-    id_vars='Skills_Category',
-    var_name='CGPA_Range',
-    value_name='Percentage'
-)
-
-fig3 = px.bar(
-    percentage,
-    y='Skills_Category',
-    x='Percentage',
-    color='CGPA_Range',
-    orientation='h',
-    text=percentage['Percentage'].round(1),
-    color_discrete_sequence=px.colors.qualitative.Bold
-)
-
-st.plotly_chart(fig3, use_container_width=True)
+with timer("3. Skills CGPA share", "send"):
+    st.plotly_chart(fig3, use_container_width=True)
 
 st.markdown(f"""
 <div style="{interpretation_style}">
@@ -263,18 +255,13 @@ emphasising leadership and tool-based competency.
 # =====================================================
 st.markdown(f'<div style="{block_style}"><h3>4️⃣ CGPA Progression by Year & Skill Level</h3></div>', unsafe_allow_html=True)
 
-line_data = filtered_df.groupby(
-    ['Year_of_Study', 'Skill_Development_Hours_Category']
-)['CGPA_Midpoint'].mean().reset_index()
+with timer("4. CGPA progression", "data"):
+    line_data = analytics.cgpa_progression(filtered_df)
 
-fig4 = px.line(
-    line_data,
-    x='Year_of_Study',
-    y='CGPA_Midpoint',
-    color='Skill_Development_Hours_Category',
-    markers=True
-)
-st.plotly_chart(fig4, use_container_width=True)
+with timer("4. CGPA progression", "figure"):
+    fig4 = cached_figure("objective4/cgpa_progression", version, lambda: charts.cgpa_progression_line(line_data), **filters)
+with timer("4. CGPA progression", "send"):
+    st.plotly_chart(fig4, use_container_width=True)
 
 st.markdown(f"""
 <div style="{interpretation_style}">
@@ -303,20 +290,13 @@ development becomes unsustainable when core academic rigour increases in the sen
 # =====================================================
 st.markdown(f'<div style="{block_style}"><h3>5️⃣ Average CGPA Heatmap</h3></div>', unsafe_allow_html=True)
 
-heatmap_data = filtered_df.pivot_table(
-    values='CGPA_Midpoint',
-    index='Skill_Development_Hours_Category',
-    columns='Co_Curriculum_Activities_Text',
-    aggfunc='mean'
-)
+with timer("5. CGPA heatmap", "data"):
+    heatmap_data = analytics.cgpa_heatmap(filtered_df)
 
-fig5 = px.imshow(
-    heatmap_data,
-    text_auto='.2f',
-    color_continuous_scale='PuBu',
-    aspect='auto'
-)
-st.plotly_chart(fig5, use_container_width=True)
+with timer("5. CGPA heatmap", "figure"):
+    fig5 = cached_figure("objective4/cgpa_heatmap", version, lambda: charts.cgpa_heatmap(heatmap_data), **filters)
+with timer("5. CGPA heatmap", "send"):
+    st.plotly_chart(fig5, use_container_width=True)
 
 st.markdown(f"""
 <div style="{interpretation_style}">
@@ -0,0 +1,140 @@
+import atexit
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from streaming import StreamingAggregates
+
+# ---------------------------------------
+# PROCESS-POOL PARALLEL AGGREGATION
+# ---------------------------------------
+# groupby / crosstab work otherwise runs on one core inside the Streamlit
+# script thread. parallel_aggregates() splits the rows into partitions
+# (whole faculties by default, so one faculty's rows never straddle two
+# workers), folds each partition into a StreamingAggregates in a worker
+# process and adds the partial sums and counts together. The merge is
+# exact: every aggregate is a sum, so the result does not depend on how the
+# rows were split.
+#
+# Small frames are aggregated inline; shipping rows to a worker only pays
+# off once there are PARALLEL_ROWS of them.
+#
+# Inside the Streamlit server the workers come from a forkserver: forking
+# the multithreaded server itself could copy a lock held by another thread
+# (logging, the import lock, Arrow's pool) into a child that then deadlocks.
+# Command-line tools (benchmark.py, analytics.py) are single-threaded when
+# the pool starts and keep the cheaper fork.
+#
+# Under Streamlit the pool is created once, when this module is first
+# imported, and every worker is started there and then, so no later submit
+# spawns a process. A new worker would otherwise re-run the parent's
+# __main__, which Streamlit has replaced with the page script; the
+# forkserver is told that script's path instead and treats it as already
+# loaded, so its workers only import this module.
+#   EDUTRACK_AGG_WORKERS         worker processes (default: CPU count)
+#   EDUTRACK_AGG_PARALLEL_ROWS   rows below which no pool is used
+#   EDUTRACK_AGG_MAIN            set by the pool for its forkserver
+
+PARTITION_KEY = "Faculty_Short"
+WORKERS = int(os.environ.get("EDUTRACK_AGG_WORKERS", "0")) or os.cpu_count() or 1
+PARALLEL_ROWS = int(os.environ.get("EDUTRACK_AGG_PARALLEL_ROWS", "200000"))
+
+_executor = None
+_executor_method = None
+_lock = threading.Lock()
+
+if os.environ.get("EDUTRACK_AGG_MAIN") and not hasattr(sys.modules["__main__"], "__file__"):
+    # Running in the forkserver: workers forked from here skip the script
+    sys.modules["__main__"].__file__ = os.environ["EDUTRACK_AGG_MAIN"]
+
+
+def _in_streamlit():
+    if "streamlit" not in sys.modules:
+        return False
+    from streamlit import runtime
+
+    return runtime.exists()
+
+
+def _start_method():
+    methods = multiprocessing.get_all_start_methods()
+    if _in_streamlit():
+        return "forkserver" if "forkserver" in methods else "spawn"
+    return "fork" if "fork" in methods else "spawn"
+
+
+def _pool():
+    global _executor, _executor_method
+    with _lock:
+        if _executor is None:
+            _executor_method = _start_method()
+            context = multiprocessing.get_context(_executor_method)
+            if _executor_method == "forkserver":
+                # The server only needs this module, not the default __main__
+                context.set_forkserver_preload([__name__])
+                main_path = getattr(sys.modules["__main__"], "__file__", None)
+                if main_path:
+                    os.environ["EDUTRACK_AGG_MAIN"] = os.path.normpath(os.path.abspath(main_path))
+            _executor = ProcessPoolExecutor(max_workers=WORKERS, mp_context=context)
+            atexit.register(_executor.shutdown, cancel_futures=True)
+            if _executor_method != "fork":
+                # Start every worker now: each submit finds no idle worker
+                # and spawns one. Not waited on, as this may run mid-import
+                for _ in range(WORKERS):
+                    _executor.submit(_ready)
+        return _executor
+
+
+def _ready():
+    return os.getpid()
+
+
+def partitions(df, key=PARTITION_KEY, n=WORKERS):
+    """Row positions of ``df`` split into at most ``n`` balanced partitions.
+
+    With a ``key``, all rows sharing a key value land in the same partition
+    (largest groups are placed first, each into the lightest partition);
+    without one, the rows are cut into contiguous ranges.
+    """
+    if key is None:
+        return [part for part in np.array_split(np.arange(len(df)), n) if len(part)]
+    groups = sorted(df.groupby(key, observed=True).indices.values(), key=len, reverse=True)
+    bins = [[] for _ in range(min(n, len(groups)))]
+    sizes = [0] * len(bins)
+    for rows in groups:
+        lightest = sizes.index(min(sizes))
+        bins[lightest].append(rows)
+        sizes[lightest] += len(rows)
+    return [np.sort(np.concatenate(b)) for b in bins if b]
+
+
+def _aggregate(spec, frame):
+    return StreamingAggregates(**spec).update(frame)
+
+
+def parallel_aggregates(df, spec, key=PARTITION_KEY, workers=WORKERS):
+    """``StreamingAggregates(**spec)`` over all of ``df``, partitioned across processes.
+
+    ``spec`` takes the keyword arguments of StreamingAggregates (means,
+    counts, crosstabs, correlations).
+    """
+    result = StreamingAggregates(**spec)
+    if workers <= 1 or df.empty or len(df) < PARALLEL_ROWS:
+        return result.update(df)
+
+    frame = df[sorted(set(result.columns) | ({key} if key else set()))]
+    parts = partitions(frame, key, workers)
+    chunks = [frame.take(rows) for rows in parts]
+    pool = _pool()
+    futures = [pool.submit(_aggregate, spec, chunk) for chunk in chunks]
+    for future in futures:
+        result.merge(future.result())
+    return result
+
+
+if WORKERS > 1 and _in_streamlit():
+    _pool()
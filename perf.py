@@ -0,0 +1,206 @@
+import functools
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+
+import numpy as np
+
+# ---------------------------------------
+# PER-SECTION TIMING
+# ---------------------------------------
+# Each numbered section of a page records three phases separately:
+#   data     pandas work (analytics tables, groupby, describe)
+#   figure   building the plotly figure (or the figure cache lookup)
+#   send     st.plotly_chart / st.dataframe: serializing and queueing the
+#            message to the browser
+# Pages wrap their statements in ``with timer(section, phase):``; a phase
+# may be entered several times per rerun and accumulates. Phases nest: data
+# work done inside a figure builder on a cache miss is wrapped with
+# ``timer.call(section, "data", func, ...)`` and is not counted as figure.
+#
+# Sections with their own widgets are st.fragment functions declared with
+# ``@timer.fragment``: changing such a widget reruns that section only. A
+# fragment rerun is recorded in the rolling history as a rerun of its own
+# sections; the sidebar panel catches up on the next full rerun.
+#
+# With EDUTRACK_PERF=1, main.py shows a sidebar panel with the breakdown of
+# the last rerun and the rolling p50 / p95 of each section and phase over
+# the last WINDOW reruns of the process. Otherwise timer() hands out a
+# shared no-op, so an instrumented page pays one call and an empty
+# context manager per phase.
+#
+#   EDUTRACK_PERF          1 to record timings and show the panel
+#   EDUTRACK_PERF_WINDOW   reruns kept per section for p50 / p95 (default 200)
+
+ENABLED = os.environ.get("EDUTRACK_PERF", "") not in ("", "0")
+WINDOW = int(os.environ.get("EDUTRACK_PERF_WINDOW", "200"))
+PHASES = ("data", "figure", "send")
+
+_history = defaultdict(lambda: deque(maxlen=WINDOW))
+_lock = threading.Lock()
+
+
+class _NullTimer:
+    _context = nullcontext()
+
+    def __call__(self, section, phase):
+        return self._context
+
+    def call(self, section, phase, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def fragment(self, func):
+        import streamlit as st
+
+        return st.fragment(func)
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Phase:
+    __slots__ = ("timer", "key", "start")
+
+    def __init__(self, timer, key):
+        self.timer = timer
+        self.key = key
+
+    def __enter__(self):
+        self.timer.stack.append(self)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        stack = self.timer.stack
+        stack.pop()
+        self.timer.run[self.key] += elapsed
+        # The enclosing phase only keeps its own time
+        if stack:
+            self.timer.run[stack[-1].key] -= elapsed
+
+
+class PageTimer:
+    """Phase timings of one rerun of ``page``."""
+
+    def __init__(self, page):
+        self.page = page
+        self.run = defaultdict(float)
+        self.stack = []
+        self.recorded = False
+
+    def __call__(self, section, phase):
+        return _Phase(self, (section, phase))
+
+    def call(self, section, phase, func, *args, **kwargs):
+        """``func(*args, **kwargs)``, timed as ``phase`` of ``section``."""
+        with self(section, phase):
+            return func(*args, **kwargs)
+
+    def fragment(self, func):
+        """``st.fragment(func)``, recording each fragment rerun of it on its own."""
+        import streamlit as st
+
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            # During the full rerun the section is timed with the rest of the page
+            if not self.recorded:
+                return func(*args, **kwargs)
+            self.run, self.stack = defaultdict(float), []
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record()
+
+        return st.fragment(run)
+
+    def breakdown(self):
+        """This rerun's seconds per section (rows) and phase (columns)."""
+        import pandas as pd
+
+        if self.run:
+            table = pd.Series(self.run, dtype=float).unstack(fill_value=0.0, sort=False)
+        else:
+            table = pd.DataFrame()
+        table = table.reindex(columns=PHASES, fill_value=0.0)
+        table["total"] = table.sum(axis=1)
+        return table
+
+    def finish(self):
+        """Add this rerun to the rolling history (once)."""
+        if self.recorded:
+            return
+        self.recorded = True
+        self._record()
+
+    def _record(self):
+        totals = defaultdict(float)
+        with _lock:
+            for (section, phase), seconds in self.run.items():
+                _history[(self.page, section, phase)].append(seconds)
+                totals[section] += seconds
+            for section, seconds in totals.items():
+                _history[(self.page, section, "total")].append(seconds)
+
+
+def timer(page):
+    """Timer for this rerun of ``page``; a no-op unless EDUTRACK_PERF is set."""
+    if not ENABLED:
+        return NULL_TIMER
+    import streamlit as st
+
+    page_timer = PageTimer(page)
+    st.session_state["_perf_timer"] = page_timer
+    return page_timer
+
+
+def percentiles(page):
+    """Rolling p50 / p95 (seconds) and run count per section and phase of ``page``."""
+    import pandas as pd
+
+    with _lock:
+        samples = {key[1:]: list(values) for key, values in _history.items() if key[0] == page}
+    rows = [
+        {"section": section, "phase": phase, "runs": len(values),
+         "p50": float(np.percentile(values, 50)), "p95": float(np.percentile(values, 95))}
+        for (section, phase), values in samples.items()
+    ]
+    return pd.DataFrame(rows, columns=["section", "phase", "runs", "p50", "p95"])
+
+
+def reset():
+    with _lock:
+        _history.clear()
+
+
+# ---------------------------------------
+# DEVELOPER PANEL
+# ---------------------------------------
+def panel():
+    """Sidebar breakdown of the page that just ran (EDUTRACK_PERF only)."""
+    if not ENABLED:
+        return
+    import streamlit as st
+
+    page_timer = st.session_state.pop("_perf_timer", None)
+    if page_timer is None:
+        return
+    page_timer.finish()
+
+    with st.sidebar.expander(f"⏱️ Section timings: {page_timer.page}", expanded=True):
+        breakdown = page_timer.breakdown()
+        st.caption(f"This rerun: {breakdown['total'].sum() * 1000:.1f} ms in instrumented sections")
+        st.dataframe((breakdown * 1000).round(1), use_container_width=True)
+
+        stats = percentiles(page_timer.page)
+        if not stats.empty:
+            rolling = stats.pivot_table(index="section", columns="phase", values=["p50", "p95"], sort=False)
+            rolling = (rolling * 1000).round(1)
+            rolling.columns = [f"{phase} {stat}" for stat, phase in rolling.columns]
+            order = [f"{phase} {stat}" for phase in (*PHASES, "total") for stat in ("p50", "p95")]
+            st.caption(f"Rolling p50 / p95 in ms over the last {int(stats['runs'].max())} reruns")
+            st.dataframe(rolling.reindex(columns=[c for c in order if c in rolling.columns]),
+                         use_container_width=True)
+        if st.button("Reset timings", key="_perf_reset"):
+            reset()
@@ -0,0 +1,258 @@
+import cProfile
+import hashlib
+import hmac
+import json
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# ---------------------------------------
+# ON-DEMAND RERUN PROFILING
+# ---------------------------------------
+# Captures one full rerun of the current page (main.py wraps pg.run()) with
+# either profiler:
+#   cprofile   deterministic, every call timed; slows the rerun down
+#   sample     a background thread records the script thread's stack every
+#              EDUTRACK_PROFILE_INTERVAL_MS; overhead stays low
+# and writes three files to EDUTRACK_PROFILE_DIR, named after the page and
+# a hash of its widget state:
+#   <page>-<state>-<time>.pstats     python -m pstats / snakeviz
+#   <page>-<state>-<time>.collapsed  flamegraph.pl / speedscope
+#   <page>-<state>-<time>.json       page, widget state, query parameters
+#
+# Switching it on:
+#   EDUTRACK_PROFILE=cprofile|sample    profile every rerun of the process
+#   ?profile=cprofile|sample&profile_token=<EDUTRACK_PROFILE_TOKEN>
+#                                       profile the next rerun of this session
+#                                       (ignored unless the token is set)
+
+MODES = ("cprofile", "sample")
+MODE = os.environ.get("EDUTRACK_PROFILE", "").strip().lower()
+MODE = "cprofile" if MODE in ("1", "true") else MODE
+TOKEN = os.environ.get("EDUTRACK_PROFILE_TOKEN", "")
+OUT_DIR = Path(os.environ.get("EDUTRACK_PROFILE_DIR", Path(__file__).resolve().parent / "profiles"))
+INTERVAL = float(os.environ.get("EDUTRACK_PROFILE_INTERVAL_MS", "5")) / 1000
+
+# Edges worth less than this are left out of the collapsed cProfile stacks
+MIN_SECONDS = 1e-4
+
+
+# ---------------------------------------
+# SAMPLING PROFILER
+# ---------------------------------------
+def _label(code):
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+class SamplingProfiler:
+    """Stack samples of one thread, taken from a background thread."""
+
+    def __init__(self, thread_id=None, interval=INTERVAL):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        own = sys._current_frames
+        while not self._stop.wait(self.interval):
+            frame = own().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="edutrack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def stats(self):
+        """pstats-style ``{func: (cc, nc, tt, ct, callers)}`` in sampled seconds.
+
+        Call counts are sample counts: a sampler does not see calls.
+        """
+        self_time, total, edges = Counter(), Counter(), defaultdict(Counter)
+        for stack, count in self.samples.items():
+            self_time[stack[-1]] += count
+            for func in set(stack):
+                total[func] += count
+            seen = set()
+            for caller, callee in zip(stack, stack[1:]):
+                if (caller, callee) not in seen:
+                    seen.add((caller, callee))
+                    edges[callee][caller] += count
+        seconds = self.interval
+        return {
+            func: (
+                total[func], total[func], self_time[func] * seconds, total[func] * seconds,
+                {caller: (n, n, 0.0, n * seconds) for caller, n in edges[func].items()},
+            )
+            for func in total
+        }
+
+    def collapsed(self):
+        """Folded stacks, one ``a;b;c count`` line per distinct stack."""
+        return {";".join(_frame_name(f) for f in stack): count for stack, count in self.samples.items()}
+
+
+# ---------------------------------------
+# OUTPUT
+# ---------------------------------------
+def _frame_name(func):
+    filename, line, name = func
+    # flamegraph.pl splits frames on ";"
+    return f"{name} ({Path(filename).name}:{line})".replace(";", ":")
+
+
+def collapsed_from_pstats(stats):
+    """Folded stacks approximated from a cProfile call graph.
+
+    cProfile keeps caller -> callee totals, not whole stacks, so a callee's
+    time is split over its callers in proportion to what each one spent in
+    it (the usual attribution of pstats-to-flamegraph converters). Values
+    are microseconds.
+    """
+    children = defaultdict(list)
+    for callee, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            children[caller].append((callee, edge[3]))
+    roots = [func for func, entry in stats.items() if not entry[4]]
+
+    folded = Counter()
+
+    def walk(func, stack, seconds):
+        cumulative = stats[func][3]
+        share = seconds / cumulative if cumulative > 0 else 0.0
+        own = stats[func][2] * share
+        if own * 1e6 >= 1:
+            folded[";".join(stack)] += int(own * 1e6)
+        for callee, edge_seconds in children[func]:
+            child_seconds = edge_seconds * share
+            name = _frame_name(callee)
+            if child_seconds >= MIN_SECONDS and name not in stack:
+                walk(callee, stack + [name], child_seconds)
+
+    for root in roots:
+        walk(root, [_frame_name(root)], stats[root][3])
+    return folded
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def write_profile(stats, folded, page, state, mode, seconds, out_dir=OUT_DIR):
+    """Write the .pstats, .collapsed and .json files; returns the .pstats path."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha1(json.dumps(state, sort_keys=True, default=repr).encode("utf-8")).hexdigest()[:8]
+    slug = "".join(c if c.isalnum() or c in "-_" else "-" for c in page)
+    stem = out_dir / f"{slug}-{digest}-{datetime.now():%Y%m%d-%H%M%S-%f}"
+
+    with open(stem.with_suffix(".pstats"), "wb") as f:
+        marshal.dump(stats, f)
+    stem.with_suffix(".collapsed").write_text(
+        "".join(f"{stack} {count}\n" for stack, count in folded.items()), encoding="utf-8"
+    )
+    stem.with_suffix(".json").write_text(json.dumps({
+        "page": page,
+        "mode": mode,
+        "seconds": seconds,
+        "widgets": {key: _jsonable(value) for key, value in state.get("widgets", {}).items()},
+        "query": state.get("query", {}),
+    }, indent=2), encoding="utf-8")
+    return stem.with_suffix(".pstats")
+
+
+# ---------------------------------------
+# STREAMLIT HOOK
+# ---------------------------------------
+def requested_mode():
+    """Profiler to run for this rerun, or None."""
+    if MODE in MODES:
+        return MODE
+    if not TOKEN:
+        return None
+    import streamlit as st
+
+    params = st.query_params
+    mode = params.get("profile", "")
+    if mode in MODES and hmac.compare_digest(params.get("profile_token", ""), TOKEN):
+        return mode
+    return None
+
+
+def _widget_state():
+    import streamlit as st
+
+    return {
+        "widgets": {
+            str(key): value for key, value in st.session_state.to_dict().items()
+            if not str(key).startswith("_")
+        },
+        "query": {key: value for key, value in st.query_params.to_dict().items() if key != "profile_token"},
+    }
+
+
+@contextmanager
+def capture(page):
+    """Profile the body (one rerun of ``page``) when profiling is requested."""
+    mode = requested_mode()
+    if mode is None:
+        yield None
+        return
+
+    import streamlit as st
+
+    start = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+    else:
+        profiler = SamplingProfiler()
+        profiler.start()
+    interrupted = False
+    try:
+        yield mode
+    except BaseException:
+        # st.rerun() / st.stop() end the rerun early; the partial profile is kept
+        interrupted = True
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        if mode == "cprofile":
+            profiler.disable()
+            profiler.create_stats()
+            stats = profiler.stats
+            folded = collapsed_from_pstats(stats)
+        else:
+            profiler.stop()
+            stats = profiler.stats()
+            folded = profiler.collapsed()
+
+        # Widget values as the rerun saw them
+        path = write_profile(stats, folded, page, _widget_state(), mode, seconds)
+        print(f"[profile] {page} rerun ({mode}, {seconds:.2f}s) written to {path}", file=sys.stderr)
+        if MODE not in MODES and not interrupted:
+            # A query-parameter capture covers one rerun only
+            for key in ("profile", "profile_token"):
+                if key in st.query_params:
+                    del st.query_params[key]
+            st.sidebar.caption(f"Profile of this rerun written to {path.name}")
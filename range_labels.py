@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------
+# RANGE-LABEL PARSING ENGINE
+# ---------------------------------------
+# Survey answers are range labels such as "3 – 4 hours", "< 1 hours",
+# "81% - 100%", "3.00 – 3.69" or "RM 1,501 - RM3,000". Each distinct label
+# is parsed once with vectorized regex and the bounds are broadcast to the
+# rows through category / factorize codes, so the cost depends on the
+# number of distinct answers, not on the number of students.
+#
+# Open-ended labels: "< x" is read as 0 – x and "> x" as x – (x + open_width).
+
+RANGE_PATTERN = r"^\s*(?P<op>[<>])?\D*?(?P<lo>\d+(?:\.\d+)?)(?:\D+?(?P<hi>\d+(?:\.\d+)?))?"
+
+
+def distinct_codes(values):
+    """Integer codes into the distinct values (-1 for missing)."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), pd.Series(values.cat.categories, dtype="string")
+    codes, uniques = pd.factorize(values)
+    return codes, pd.Series(uniques, dtype="string")
+
+
+def per_label(values, func):
+    """Apply a Series -> Series/DataFrame ``func`` to distinct values only."""
+    codes, distinct = distinct_codes(values)
+    result = func(distinct)
+    result = result.reindex(range(-1, len(distinct)))  # code -1 (missing) -> NaN row
+    out = result.iloc[codes + 1]
+    out.index = values.index
+    return out
+
+
+def parse_distinct(labels, open_width=1.0):
+    """Lower, upper and midpoint arrays for a Series of distinct labels."""
+    parts = labels.str.replace(",", "", regex=False).str.extract(RANGE_PATTERN)
+    first = parts["lo"].astype(float).to_numpy()
+    second = parts["hi"].astype(float).to_numpy()
+    below = parts["op"].eq("<").fillna(False).to_numpy(bool)
+    above = parts["op"].eq(">").fillna(False).to_numpy(bool)
+    lower = np.where(below, 0.0, first)
+    upper = np.where(below, first, np.where(above, first + open_width, np.where(np.isnan(second), first, second)))
+    return lower, upper, (lower + upper) / 2
+
+
+def range_bounds(labels, open_width=1.0):
+    """Per-row ``(lower, upper, midpoint)`` numpy arrays for a label column."""
+    codes, distinct = distinct_codes(labels)
+    # A trailing NaN slot makes code -1 (missing label) broadcast to NaN
+    return tuple(
+        np.append(bound, np.nan)[codes]
+        for bound in parse_distinct(distinct, open_width)
+    )
+
+
+def parse_ranges(labels, open_width=1.0):
+    """Lower bound, upper bound and midpoint of range labels as a DataFrame."""
+    lower, upper, mid = range_bounds(labels, open_width)
+    return pd.DataFrame({"lower": lower, "upper": upper, "mid": mid}, index=labels.index)
+
+
+def sort_labels(labels):
+    """Distinct non-missing labels ordered by numeric lower then upper bound."""
+    distinct = pd.Series(pd.unique(labels.dropna()), dtype="string")
+    lower, upper, _ = parse_distinct(distinct)
+    order = np.lexsort((upper, lower))
+    return distinct.iloc[order].tolist()
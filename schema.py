@@ -0,0 +1,82 @@
+import pandas as pd
+
+from range_labels import sort_labels
+
+# ---------------------------------------
+# CATEGORICAL SCHEMA FOR THE CLEANED DATASET
+# ---------------------------------------
+# The repeated survey answers are loaded as pandas Categoricals: groupby,
+# crosstab and equality filters then work on small integer codes instead of
+# hashing strings, and memory drops several-fold. Ordered columns sort by
+# meaning (numeric lower bound, Low < Medium < High, B40 < M40 < T20), so
+# grouped results already come out in chart order.
+
+# Unordered answers
+NOMINAL_COLUMNS = [
+    "Gender", "Races", "Faculty", "Faculty_Short", "Relationship_Status",
+    "Living_With", "Learning_Mode", "Co_Curriculum_Activities_Text",
+    "Health_Issues_Text", "Skills_Category",
+]
+
+# Range labels, ordered by their numeric lower bound
+RANGE_COLUMNS = [
+    "Age", "Family_Income", "Attendance_Percentage", "GPA", "CGPA",
+    "Study_Hours_Daily", "Social_Media_Hours_Daily", "Skill_Development_Hours_Daily",
+]
+
+# Columns with a fixed semantic order
+FIXED_ORDER_COLUMNS = {
+    "Study_Hours_Category": ["Low", "Medium", "High"],
+    "Social_Media_Hours_Category": ["Low", "Medium", "High"],
+    "Skill_Development_Hours_Category": ["Low", "Medium", "High"],
+    "Study_Sessions_Category": ["Low", "Medium", "High"],
+    "Income_Category": ["B40", "M40", "T20"],
+}
+
+# Integer answers kept numeric in the CSV but grouped as ordered categories
+ORDINAL_INT_COLUMNS = ["Year_of_Study"]
+
+CATEGORY_COLUMNS = NOMINAL_COLUMNS + RANGE_COLUMNS + list(FIXED_ORDER_COLUMNS)
+
+
+def read_csv_dtypes():
+    """``dtype=`` argument for pd.read_csv so labels are parsed straight into categories."""
+    return {col: "category" for col in CATEGORY_COLUMNS}
+
+
+def _ordered(series, order):
+    # Labels outside the declared order are kept, after the known ones
+    present = list(series.cat.categories)
+    categories = [c for c in order if c in present] + [c for c in present if c not in order]
+    return series.cat.set_categories(categories, ordered=True)
+
+
+def apply_schema(df):
+    """Convert the survey columns of a cleaned frame to (ordered) Categoricals."""
+    for col in CATEGORY_COLUMNS + ORDINAL_INT_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+
+    for col in RANGE_COLUMNS:
+        if col in df.columns:
+            df[col] = _ordered(df[col], sort_labels(pd.Series(df[col].cat.categories)))
+    for col, order in FIXED_ORDER_COLUMNS.items():
+        if col in df.columns:
+            df[col] = _ordered(df[col], order)
+    for col in ORDINAL_INT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].cat.as_ordered()
+    return df
+
+
+def category_orders(df, *columns):
+    """``category_orders`` for plotly express, taken from the declared categories.
+
+    plotly orders groups by first appearance, so charts drawn from row-level
+    data pass this to follow the schema order.
+    """
+    return {
+        col: list(df[col].cat.categories)
+        for col in columns
+        if isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
@@ -0,0 +1,127 @@
+import argparse
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from schema import apply_schema
+
+# ---------------------------------------
+# COLUMNAR PARQUET SNAPSHOTS
+# ---------------------------------------
+# The cleaned CSV is parsed once per dataset version into a Parquet file
+# that keeps the categorical dictionaries and numeric dtypes. Pages then
+# read only the columns they use, so parse time and resident memory scale
+# with the projection instead of with all 33+ columns.
+#
+#   python snapshot.py cleaned_student_performance_ver2.csv cleaned.parquet
+#
+# The frames read here are shared by reference by every session of the
+# process. Their numpy buffers (numeric columns, category codes) are marked
+# non-writeable, so an in-place write such as df.loc[...] = ... raises
+# instead of silently changing the data for everyone. Adding or replacing a
+# column on the shared frame is not caught: pages filter, never assign.
+
+_frames = {}
+_lock = threading.Lock()
+
+
+def snapshot_path(cache_dir, name, version):
+    digest = hashlib.sha1(str(version).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"{name}-{digest}.parquet"
+
+
+def write_snapshot(df, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+def _old_snapshots(path):
+    # Other versions of the same dataset: <name>-<16 hex digits>.parquet
+    name = path.stem.rsplit("-", 1)[0]
+    pattern = re.compile(re.escape(name) + r"-[0-9a-f]{16}\.parquet")
+    return [p for p in path.parent.glob(f"{name}-*.parquet") if p != path and pattern.fullmatch(p.name)]
+
+
+def ensure_snapshot(path, build):
+    """Write the snapshot with ``build()`` unless it already exists.
+
+    Snapshots of the dataset's previous versions are deleted once the new
+    one is written, so revalidation does not pile files up on disk. Frames
+    already read from them stay in memory until their readers let go.
+    """
+    path = Path(path)
+    with _lock:
+        if not path.exists():
+            write_snapshot(build(), path)
+            for old in _old_snapshots(path):
+                old.unlink(missing_ok=True)
+    return path
+
+
+def _readonly(values):
+    values = np.asarray(values).view()
+    values.flags.writeable = False
+    return values
+
+
+def freeze(df):
+    """``df`` rebuilt on read-only views of its buffers (no copy)."""
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            columns[col] = pd.Categorical.from_codes(
+                _readonly(series.cat.codes.to_numpy()), dtype=series.dtype, validate=False
+            )
+        elif isinstance(series.dtype, np.dtype):
+            columns[col] = _readonly(series.to_numpy())
+        else:
+            # Arrow-backed strings are immutable already
+            columns[col] = series.array
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def read_snapshot(path, columns=None):
+    """Read ``columns`` (default: all) from a snapshot, memoized per process.
+
+    Frames from snapshots of other versions of the same dataset are dropped
+    when a new version is first read.
+    """
+    path = Path(path)
+    key = (path, tuple(columns) if columns is not None else None)
+    with _lock:
+        if key not in _frames:
+            stem = path.stem.rsplit("-", 1)[0]
+            for old in [k for k in _frames if k[0].stem.rsplit("-", 1)[0] == stem and k[0] != path]:
+                del _frames[old]
+            # Parquet keeps the category dictionaries; re-applying the schema
+            # restores orderings and the integer-valued categories
+            _frames[key] = freeze(apply_schema(pd.read_parquet(path, columns=key[1])))
+        return _frames[key]
+
+
+def main():
+    from data_loader import add_derived_columns
+    from schema import read_csv_dtypes
+
+    parser = argparse.ArgumentParser(description="Build a Parquet snapshot from the cleaned EduTrack CSV.")
+    parser.add_argument("csv", help="cleaned CSV")
+    parser.add_argument("out", help="Parquet file to write")
+    args = parser.parse_args()
+
+    df = add_derived_columns(pd.read_csv(args.csv, dtype=read_csv_dtypes()))
+    write_snapshot(df, args.out)
+    print(f"Wrote {len(df)} rows x {len(df.columns)} columns to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
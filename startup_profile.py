@@ -0,0 +1,170 @@
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+# ---------------------------------------
+# LAZY IMPORTS AND STARTUP TIMING
+# ---------------------------------------
+# Pages are only executed when they are opened, but whatever they import at
+# the top is paid in full on first use. lazy_module() defers a module's
+# import until one of its attributes is first read, so heavy libraries used
+# only to build (cached) figures cost nothing until a figure is actually
+# built.
+#
+# Startup cost is measured in two ways:
+#   - EDUTRACK_STARTUP_PROFILE=1 makes main.py log, once per process, how
+#     long the first request took and how many modules it imported, and
+#     warn when that exceeds EDUTRACK_STARTUP_BUDGET_SECONDS;
+#   - `python startup_profile.py [pages]` runs each page once in a fresh
+#     interpreter under -X importtime and reports the first-run latency and
+#     the slowest imports, exiting non-zero when a page is over budget.
+
+BASE_DIR = Path(__file__).resolve().parent
+ENABLED = os.environ.get("EDUTRACK_STARTUP_PROFILE", "") not in ("", "0")
+BUDGET_SECONDS = float(os.environ.get("EDUTRACK_STARTUP_BUDGET_SECONDS", "3"))
+PAGES = [
+    "home.py", "objective1_Hidayah.py", "objective2_Syazana.py",
+    "objective3_Fatin.py", "objective4_Syazwanie.py",
+]
+
+_started = time.perf_counter()
+_modules_at_start = len(sys.modules)
+_first_request = None
+_lock = threading.Lock()
+
+
+class _LazyModule:
+    # Stand-in that imports the real module on its first attribute read.
+    # importlib's LazyLoader is not thread-safe before Python 3.12, and
+    # concurrent sessions build figures on several script threads at once
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+def lazy_module(name):
+    """Module ``name``, imported on first attribute access instead of now."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
+
+
+# ---------------------------------------
+# IN-APP FIRST-REQUEST TIMING
+# ---------------------------------------
+def first_request_done(page=None):
+    """Record the first request of the process; returns its stats dict.
+
+    Only the first call does anything; later reruns return the same stats.
+    """
+    global _first_request
+    with _lock:
+        if _first_request is None:
+            _first_request = {
+                "page": page,
+                "seconds": time.perf_counter() - _started,
+                "modules_imported": len(sys.modules) - _modules_at_start,
+                "budget_seconds": BUDGET_SECONDS,
+            }
+            if ENABLED:
+                over = " (over budget)" if _first_request["seconds"] > BUDGET_SECONDS else ""
+                print(
+                    f"[startup] first request ({page}) served in {_first_request['seconds']:.2f}s, "
+                    f"{_first_request['modules_imported']} modules imported{over}",
+                    file=sys.stderr,
+                )
+        return _first_request
+
+
+# ---------------------------------------
+# COLD-START MEASUREMENT (CLI)
+# ---------------------------------------
+_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=600).run()
+t2 = time.perf_counter()
+print(json.dumps({
+    "streamlit_import": t1 - t0,
+    "first_run": t2 - t1,
+    "exceptions": [e.value for e in at.exception],
+}))
+"""
+
+
+def parse_importtime(stderr):
+    """Top-level ``(module, cumulative_seconds)`` pairs from -X importtime output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        # Nested imports are indented under the module that triggered them
+        if name.startswith(" ") and not name.startswith("  "):
+            try:
+                imports.append((name.strip(), int(cumulative) / 1e6))
+            except ValueError:
+                continue
+    return imports
+
+
+def measure_page(page):
+    """Cold start of one page in a fresh interpreter."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, page],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"{page} failed to start:\n{proc.stderr[-2000:]}")
+    result = json.loads(lines[-1])
+    result.update(page=page, total=wall, imports=parse_importtime(proc.stderr))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold first-request latency of dashboard pages.")
+    parser.add_argument("pages", nargs="*", default=PAGES, help="page scripts (default: all pages)")
+    parser.add_argument("--budget", type=float, default=BUDGET_SECONDS, help="seconds allowed per page")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list per page")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = [measure_page(page) for page in args.pages]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            status = "OVER BUDGET" if r["total"] > args.budget else "ok"
+            print(f"{r['page']}: {r['total']:.2f}s total, {r['streamlit_import']:.2f}s streamlit import, "
+                  f"{r['first_run']:.2f}s first run [{status}]")
+            for name, seconds in sorted(r["imports"], key=lambda item: -item[1])[:args.top]:
+                print(f"    {seconds * 1000:8.1f} ms  {name}")
+            for exc in r["exceptions"]:
+                print(f"    exception: {exc}")
+    return 1 if any(r["total"] > args.budget for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data_loader import MIDPOINT_COLUMNS, add_midpoint_columns
+from schema import apply_schema
+
+# ---------------------------------------
+# CHUNKED STREAMING AGGREGATION
+# ---------------------------------------
+# For exports larger than memory: the cleaned dataset is read in fixed-size
+# chunks (CSV or Parquet) and each chunk is folded into running per-group
+# sums and counts, crosstab counts and pairwise correlation sums. Only the
+# current chunk and the aggregates are ever resident, and the results match
+# what the pages compute with groupby / crosstab / corr on the full frame.
+#
+#   python streaming.py big_export.csv aggregates/ --chunksize 200000
+
+CHUNK_ROWS = 100_000
+
+# The group-level tables the objective pages draw
+PAGE_AGGREGATES = {
+    "means": [
+        (("Income_Category",), "CGPA_Midpoint"),
+        (("Faculty_Short",), "CGPA_Midpoint"),
+        (("Study_Hours_Category",), "GPA_Midpoint"),
+        (("Health_Issues_Text",), "GPA_Midpoint"),
+        (("Attendance_Midpoint",), "GPA_Midpoint"),
+        (("Learning_Mode",), "GPA_Midpoint"),
+        (("Learning_Mode", "Year_of_Study"), "CGPA_Midpoint"),
+        (("Skill_Development_Hours_Category", "Co_Curriculum_Activities_Text"), "CGPA_Midpoint"),
+        (("Year_of_Study", "Skill_Development_Hours_Category"), "CGPA_Midpoint"),
+    ],
+    "counts": [
+        ("Learning_Mode",),
+        ("Year_of_Study", "Learning_Mode"),
+    ],
+    "crosstabs": [
+        ("Skills_Category", "CGPA"),
+    ],
+    "correlations": [
+        ("Study_Hours_Daily_Midpoint", "Social_Media_Hours_Daily_Midpoint", "Attendance_Midpoint", "GPA_Midpoint"),
+    ],
+}
+
+
+def _keys(by):
+    return (by,) if isinstance(by, str) else tuple(by)
+
+
+def _add(total, part):
+    if total is None:
+        return part
+    if isinstance(total, np.ndarray):
+        return total + part
+    return total.add(part, fill_value=0)
+
+
+def _schema_order(col, labels):
+    # Category order the pages would use for these labels
+    ordered = apply_schema(pd.DataFrame({col: list(labels)}))[col]
+    if isinstance(ordered.dtype, pd.CategoricalDtype):
+        return list(ordered.cat.categories)
+    return sorted(labels)
+
+
+class StreamingAggregates:
+    """Running aggregates that are updated one chunk at a time."""
+
+    def __init__(self, means=(), counts=(), crosstabs=(), correlations=()):
+        self._means = {(_keys(by), value): None for by, value in means}
+        self._counts = {_keys(by): None for by in counts}
+        self._crosstabs = {tuple(pair): None for pair in crosstabs}
+        self._corr = {tuple(cols): None for cols in correlations}
+        self.rows = 0
+
+    @property
+    def columns(self):
+        """Columns ``update`` reads from each chunk."""
+        needed = set()
+        for by, value in self._means:
+            needed.update(by + (value,))
+        for by in self._counts:
+            needed.update(by)
+        for pair in self._crosstabs:
+            needed.update(pair)
+        for cols in self._corr:
+            needed.update(cols)
+        return sorted(needed)
+
+    @property
+    def source_columns(self):
+        """Columns of the cleaned file the chunks must be read with."""
+        return sorted({MIDPOINT_COLUMNS.get(col, col) for col in self.columns})
+
+    # ---------------------------------------
+    # UPDATE
+    # ---------------------------------------
+    def update(self, chunk):
+        self.rows += len(chunk)
+        for (by, value), total in self._means.items():
+            part = chunk.groupby(list(by), observed=True)[value].agg(["sum", "count"])
+            self._means[(by, value)] = _add(total, part)
+        for by, total in self._counts.items():
+            self._counts[by] = _add(total, chunk.groupby(list(by), observed=True).size())
+        for (index, columns), total in self._crosstabs.items():
+            # Same counts as pd.crosstab, several times faster on categoricals
+            part = chunk.groupby([index, columns], observed=True).size().unstack(fill_value=0)
+            self._crosstabs[(index, columns)] = _add(total, part)
+        for cols, total in self._corr.items():
+            values = chunk[list(cols)].to_numpy(dtype=float)
+            present = (~np.isnan(values)).astype(float)
+            filled = np.nan_to_num(values)
+            # Entry [i, j] sums over rows where both column i and column j are present
+            part = np.stack([
+                present.T @ present,
+                filled.T @ present,
+                (filled ** 2).T @ present,
+                filled.T @ filled,
+            ])
+            self._corr[cols] = _add(total, part)
+        return self
+
+    def merge(self, other):
+        """Add the aggregates of ``other`` (same spec, disjoint rows) into this one."""
+        self.rows += other.rows
+        for mine, theirs in (
+            (self._means, other._means),
+            (self._counts, other._counts),
+            (self._crosstabs, other._crosstabs),
+            (self._corr, other._corr),
+        ):
+            for key, part in theirs.items():
+                if part is not None:
+                    mine[key] = _add(mine[key], part)
+        return self
+
+    # ---------------------------------------
+    # RESULTS
+    # ---------------------------------------
+    def _ordered(self, frame, by):
+        frame = apply_schema(frame.reset_index())
+        return frame.sort_values(list(by), ignore_index=True)
+
+    def mean(self, by, value):
+        """Like ``df.groupby(by)[value].mean().reset_index()``."""
+        by = _keys(by)
+        total = self._means[(by, value)]
+        result = (total["sum"] / total["count"].where(total["count"] > 0)).rename(value)
+        return self._ordered(result.to_frame(), by)
+
+    def count(self, by, name="count"):
+        """Like ``df.groupby(by).size().reset_index(name=name)``."""
+        by = _keys(by)
+        return self._ordered(self._counts[by].astype(int).rename(name).to_frame(), by)
+
+    def crosstab(self, index, columns):
+        """Like ``pd.crosstab(df[index], df[columns])``, in schema order."""
+        table = self._crosstabs[(index, columns)].fillna(0).astype(int)
+        table = table.reindex(
+            index=_schema_order(index, table.index),
+            columns=_schema_order(columns, table.columns),
+        )
+        table.index.name, table.columns.name = index, columns
+        return table
+
+    def corr(self, columns):
+        """Like ``df[columns].corr()`` (pairwise complete observations)."""
+        cols = tuple(columns)
+        n, sx, sxx, sxy = self._corr[cols]
+        sy, syy = sx.T, sxx.T
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = n * sxy - sx * sy
+            var = (n * sxx - sx ** 2) * (n * syy - sy ** 2)
+            result = np.where(var > 0, cov / np.sqrt(var), np.nan)
+        np.fill_diagonal(result, np.where(np.diag(var) > 0, 1.0, np.nan))
+        return pd.DataFrame(result, index=list(cols), columns=list(cols))
+
+
+# ---------------------------------------
+# CHUNK READERS
+# ---------------------------------------
+def iter_chunks(path, columns=None, chunksize=CHUNK_ROWS):
+    """Chunks of a cleaned CSV or Parquet file, with the midpoint columns added."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield add_midpoint_columns(batch.to_pandas())
+    else:
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+            yield add_midpoint_columns(chunk)
+
+
+def stream_aggregates(path, aggregates=None, chunksize=CHUNK_ROWS):
+    """Fold every chunk of ``path`` into ``aggregates`` (default: PAGE_AGGREGATES)."""
+    if aggregates is None:
+        aggregates = StreamingAggregates(**PAGE_AGGREGATES)
+    for chunk in iter_chunks(path, aggregates.source_columns, chunksize):
+        aggregates.update(chunk)
+    return aggregates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute the dashboard aggregates from a cleaned export in chunks.")
+    parser.add_argument("data", help="cleaned CSV or Parquet file")
+    parser.add_argument("out", help="directory for the aggregate tables (Parquet)")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows per chunk")
+    args = parser.parse_args()
+
+    agg = stream_aggregates(args.data, chunksize=args.chunksize)
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+
+    tables = {}
+    for by, value in PAGE_AGGREGATES["means"]:
+        tables[f"mean-{value}-by-{'-'.join(by)}"] = agg.mean(by, value)
+    for by in PAGE_AGGREGATES["counts"]:
+        tables[f"count-by-{'-'.join(by)}"] = agg.count(by)
+    for index, columns in PAGE_AGGREGATES["crosstabs"]:
+        tables[f"crosstab-{index}-{columns}"] = agg.crosstab(index, columns).rename(columns=str).reset_index()
+    for cols in PAGE_AGGREGATES["correlations"]:
+        tables[f"corr-{'-'.join(cols)}"] = agg.corr(cols).reset_index(names="column")
+
+    for name, table in tables.items():
+        table.to_parquet(out / f"{name}.parquet", index=False)
+    print(f"Streamed {agg.rows} rows into {len(tables)} aggregate tables in {out}")
+
+
+if __name__ == "__main__":
+    main()
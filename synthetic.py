@@ -0,0 +1,199 @@
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from etl import CLEANED_COLUMNS, CLEANED_PATH
+
+# ---------------------------------------
+# SYNTHETIC SURVEY COHORTS
+# ---------------------------------------
+# Generates any number of schema-valid cleaned rows from the ~100 real ones.
+# The model is a tree of pairwise joint frequencies (Chow-Liu): the forced
+# PAIRS are linked first, then the remaining answer columns are joined by
+# the pairs with the highest mutual information. Sampling walks the tree
+# from the root, drawing each column from its frequencies conditioned on
+# its parent, so every tree edge keeps the real pairwise distribution and
+# every column keeps its marginal (including skews such as the FSDK
+# majority). Columns the ETL derives (midpoints, categories, short names,
+# cleaned skills) are looked up from their source answer, never sampled.
+#
+#   python synthetic.py cohort_1m.csv --rows 1000000
+#   python synthetic.py cohort_1m.parquet --rows 1000000   # ready-made snapshot
+
+# Answer column -> columns derived from it by etl.transform
+DERIVED = {
+    "Age": ["Age_Midpoint"],
+    "Faculty": ["Faculty_Short"],
+    "Family_Income": ["Income_Category", "Family_Income_Midpoint"],
+    "Attendance_Percentage": ["Attendance_Midpoint"],
+    "GPA": ["GPA_Midpoint"],
+    "CGPA": ["CGPA_Midpoint"],
+    "Study_Hours_Daily": ["Study_Hours_Category"],
+    "Social_Media_Hours_Daily": ["Social_Media_Hours_Category"],
+    "Skills": ["Cleaned_Skills", "Skills_Category"],
+    "Skill_Development_Hours_Daily": ["Skill_Development_Hours_Category"],
+    "Co_Curriculum_Activities": ["Co_Curriculum_Activities_Text"],
+    "Health_Issues": ["Health_Issues_Text"],
+}
+SAMPLED_COLUMNS = [
+    col for col in CLEANED_COLUMNS
+    if not any(col in derived for derived in DERIVED.values())
+]
+
+# Pairs whose joint distribution the tree always keeps
+PAIRS = [
+    ("Faculty", "Year_of_Study"),
+    ("Study_Hours_Daily", "GPA"),
+    ("GPA", "CGPA"),
+    ("Living_With", "Attendance_Percentage"),
+]
+ROOT = "Faculty"
+
+# Free-text answers: nearly one label per student, so their mutual
+# information with anything is inflated; they are only ever tree leaves
+LEAF_COLUMNS = ["Skills"]
+
+
+def _mutual_information(a, b, na, nb):
+    joint = np.bincount(a * nb + b, minlength=na * nb).reshape(na, nb) / len(a)
+    outer = joint.sum(axis=1, keepdims=True) * joint.sum(axis=0, keepdims=True)
+    nonzero = joint > 0
+    return float((joint[nonzero] * np.log(joint[nonzero] / outer[nonzero])).sum())
+
+
+class SurveyModel:
+    """Tree of pairwise answer frequencies learned from a cleaned frame."""
+
+    def __init__(self, df, pairs=PAIRS, root=ROOT):
+        df = df[CLEANED_COLUMNS].dropna()
+        self.rows = len(df)
+        self.values, codes = {}, {}
+        for col in SAMPLED_COLUMNS:
+            codes[col], self.values[col] = pd.factorize(df[col], sort=True)
+
+        # Derived values are a function of their source answer
+        self.derived = {
+            source: df.groupby(source, sort=True)[derived].first().reindex(self.values[source])
+            for source, derived in DERIVED.items()
+        }
+
+        self.edges = self._spanning_tree(codes, pairs)
+        self.order, self.parent = self._orient(root)
+        self.tables = {}
+        for col in self.order:
+            k = len(self.values[col])
+            parent = self.parent[col]
+            if parent is None:
+                counts = np.bincount(codes[col], minlength=k)[None, :]
+            else:
+                kp = len(self.values[parent])
+                counts = np.bincount(codes[parent] * k + codes[col], minlength=kp * k).reshape(kp, k)
+            # Cumulative conditional frequencies, one row per parent value
+            self.tables[col] = np.cumsum(counts, axis=1) / counts.sum(axis=1, keepdims=True)
+
+    def _spanning_tree(self, codes, pairs):
+        # Kruskal: forced pairs first, then by decreasing mutual information
+        sizes = {col: len(self.values[col]) for col in SAMPLED_COLUMNS}
+        inner = [col for col in SAMPLED_COLUMNS if col not in LEAF_COLUMNS]
+
+        def score(a, b):
+            return _mutual_information(codes[a], codes[b], sizes[a], sizes[b])
+
+        scored = sorted((-score(a, b), a, b) for i, a in enumerate(inner) for b in inner[i + 1:])
+        component = {col: col for col in SAMPLED_COLUMNS}
+
+        def find(col):
+            while component[col] != col:
+                component[col] = component[component[col]]
+                col = component[col]
+            return col
+
+        edges = []
+        for a, b in list(pairs) + [(a, b) for _, a, b in scored]:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                component[ra] = rb
+                edges.append((a, b))
+        for leaf in LEAF_COLUMNS:
+            if find(leaf) == leaf:
+                edges.append((max(inner, key=lambda col: score(col, leaf)), leaf))
+        return edges
+
+    def _orient(self, root):
+        neighbours = defaultdict(list)
+        for a, b in self.edges:
+            neighbours[a].append(b)
+            neighbours[b].append(a)
+        order, parent = [root], {root: None}
+        for col in order:
+            for other in neighbours[col]:
+                if other not in parent:
+                    parent[other] = col
+                    order.append(other)
+        return order, parent
+
+    def sample(self, rows, seed=None):
+        """``rows`` synthetic students in the cleaned CSV's columns.
+
+        Answer labels come back as Categoricals, numbers as numbers.
+        """
+        rng = np.random.default_rng(seed)
+        codes = {}
+        for col in self.order:
+            table, parent = self.tables[col], self.parent[col]
+            k = table.shape[1]
+            draws = rng.random(rows)
+            if parent is None:
+                sampled = np.searchsorted(table[0], draws, side="right")
+            else:
+                # Row p of the table is shifted to [p, p + 1], so one search over
+                # the flattened table draws every row from its parent's row
+                offsets = np.arange(len(table))[:, None]
+                flat = np.searchsorted((table + offsets).ravel(), codes[parent] + draws, side="right")
+                sampled = flat - codes[parent] * k
+            codes[col] = np.minimum(sampled, k - 1)
+
+        columns = {col: self._column(self.values[col], codes[col]) for col in SAMPLED_COLUMNS}
+        for source, derived in self.derived.items():
+            for col in derived.columns:
+                columns[col] = self._column(derived[col], codes[source])
+        return pd.DataFrame(columns)[CLEANED_COLUMNS]
+
+    @staticmethod
+    def _column(values, codes):
+        values = pd.Index(values)
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            return values.to_numpy().take(codes)
+        label_codes, labels = pd.factorize(values)
+        return pd.Categorical.from_codes(label_codes.take(codes), categories=labels)
+
+
+def synthetic_cohort(rows, seed=None, source=CLEANED_PATH):
+    """``rows`` synthetic students modelled on the cleaned CSV at ``source``."""
+    return SurveyModel(pd.read_csv(source)).sample(rows, seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic cleaned EduTrack cohort.")
+    parser.add_argument("out", help="CSV to write, or .parquet for a snapshot the pages can read")
+    parser.add_argument("--rows", type=int, default=100_000, help="number of students")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--source", default=CLEANED_PATH, help="cleaned CSV to learn from")
+    args = parser.parse_args()
+
+    df = synthetic_cohort(args.rows, args.seed, args.source)
+    if Path(args.out).suffix == ".parquet":
+        from data_loader import add_derived_columns
+        from snapshot import write_snapshot
+
+        write_snapshot(add_derived_columns(df), args.out)
+    else:
+        df.to_csv(args.out, index=False)
+    print(f"Wrote {len(df)} synthetic rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import math
+from statistics import NormalDist
+
+import numpy as np
+import plotly.graph_objects as go
+
+# ---------------------------------------
+# CLOSED-FORM OLS TRENDLINES
+# ---------------------------------------
+# Replaces plotly's trendline="ols", which imports statsmodels and refits on
+# every rerun. A simple linear fit only needs n, sum(x), sum(y), sum(x^2),
+# sum(y^2) and sum(xy): RangeTrend keeps cumulative sums of these ordered by
+# a filter column (e.g. age), so the fit for any [lo, hi] range of that
+# column is two binary searches and a few subtractions.
+
+
+def _t_quantile(p, dof):
+    # Exact closed forms at 1 and 2 degrees of freedom, where the expansion
+    # below is badly off (11.30 instead of 12.71 for the 97.5% quantile at 1).
+    # From 3 up, a Cornish-Fisher expansion of Student's t around the normal
+    # quantile: within 0.004 of the exact value at 3, 1e-3 from 5 up
+    if dof == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if dof == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    return (
+        z
+        + (z**3 + z) / (4 * dof)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * dof**3)
+        + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / (92160 * dof**4)
+    )
+
+
+class TrendFit:
+    """Least-squares line ``y = intercept + slope * x`` and its statistics."""
+
+    def __init__(self, n, slope, intercept, r2, x_mean, sxx, residual_var):
+        self.n = n
+        self.slope = slope
+        self.intercept = intercept
+        self.r2 = r2
+        self.x_mean = x_mean
+        self.sxx = sxx
+        self.residual_var = residual_var
+
+    def predict(self, xs):
+        return self.intercept + self.slope * np.asarray(xs, dtype=float)
+
+    def band(self, xs, level=0.95):
+        """Confidence band ``(lower, upper)`` of the fitted mean at ``xs``."""
+        xs = np.asarray(xs, dtype=float)
+        fitted = self.predict(xs)
+        if self.n < 3:
+            return fitted, fitted
+        t = _t_quantile(0.5 + level / 2, self.n - 2)
+        half = t * np.sqrt(self.residual_var * (1 / self.n + (xs - self.x_mean) ** 2 / self.sxx))
+        return fitted - half, fitted + half
+
+
+def fit_from_sums(n, sx, sy, sxx, syy, sxy):
+    """TrendFit from sufficient statistics, or None when x does not vary."""
+    if n < 2:
+        return None
+    x_mean, y_mean = sx / n, sy / n
+    cxx = sxx - sx * x_mean
+    cyy = syy - sy * y_mean
+    cxy = sxy - sx * y_mean
+    # Rounding noise on a constant column must not pass for variance
+    if cxx <= 1e-12 * max(sxx, 1.0):
+        return None
+    slope = cxy / cxx
+    intercept = y_mean - slope * x_mean
+    ss_res = max(cyy - slope * cxy, 0.0)
+    r2 = 1 - ss_res / cyy if cyy > 1e-12 * max(syy, 1.0) else 0.0
+    residual_var = ss_res / (n - 2) if n > 2 else 0.0
+    return TrendFit(int(n), slope, intercept, r2, x_mean, cxx, residual_var)
+
+
+def fit(x, y):
+    """Closed-form OLS fit of ``y`` on ``x`` over rows where both are present."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    both = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[both], y[both]
+    return fit_from_sums(len(x), x.sum(), y.sum(), x @ x, y @ y, x @ y)
+
+
+class RangeTrend:
+    """Fits of ``y`` on ``x`` for any value range of a ``key`` column."""
+
+    def __init__(self, df, x, y, key):
+        rows = df[list(dict.fromkeys([x, y, key]))].dropna()
+        order = np.argsort(rows[key].to_numpy(dtype=float), kind="stable")
+        keys = rows[key].to_numpy(dtype=float)[order]
+        xs = rows[x].to_numpy(dtype=float)[order]
+        ys = rows[y].to_numpy(dtype=float)[order]
+
+        self._keys = keys
+        # Row i of _sums holds the totals over the first i sorted rows
+        terms = np.column_stack([np.ones_like(xs), xs, ys, xs * xs, ys * ys, xs * ys])
+        self._sums = np.vstack([np.zeros(terms.shape[1]), np.cumsum(terms, axis=0)])
+
+    def fit(self, lo, hi):
+        """Fit over rows with ``lo <= key <= hi``; None if it cannot be fitted."""
+        start = np.searchsorted(self._keys, lo, side="left")
+        stop = np.searchsorted(self._keys, hi, side="right")
+        return fit_from_sums(*(self._sums[stop] - self._sums[start]))
+
+
+def add_trendline(fig, trend, x_min, x_max, level=0.95, color="#EF553B", name="OLS trendline"):
+    """Draw ``trend`` and its confidence band over ``[x_min, x_max]`` on ``fig``."""
+    if trend is None or not np.isfinite([x_min, x_max]).all():
+        return fig
+    xs = np.linspace(x_min, x_max, 50)
+    lower, upper = trend.band(xs, level)
+    fig.add_trace(go.Scatter(
+        x=np.concatenate([xs, xs[::-1]]),
+        y=np.concatenate([upper, lower[::-1]]),
+        fill="toself",
+        fillcolor=color,
+        opacity=0.15,
+        line={"width": 0},
+        hoverinfo="skip",
+        showlegend=False,
+        name=f"{level:.0%} confidence band",
+    ))
+    fig.add_trace(go.Scatter(
+        x=xs,
+        y=trend.predict(xs),
+        mode="lines",
+        line={"color": color},
+        name=name,
+        showlegend=False,
+        hovertemplate=(
+            f"y = {trend.intercept:.3f} + {trend.slope:.3f}·x<br>"
+            f"R² = {trend.r2:.3f}, n = {trend.n}<extra>{name}</extra>"
+        ),
+    ))
+    return fig